@@ -11,30 +11,134 @@ Version 2.0: Forced Workflow Edition
 """
 
 import argparse
-import getpass
+import functools
+import io
 import json
 import os
+import queue
 import re
+import select
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
-from urllib.parse import quote_plus
-import urllib.request
-import urllib.error
+from typing import Any, Optional, Dict, Iterable, Iterator, List, Set, Tuple
+from urllib.parse import quote_plus, unquote, urljoin, urlsplit
+
+
+# Directory of this script; the interactive helpers and help text live alongside it
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# git executable, resolved on PATH once instead of on every subprocess call
+_GIT = shutil.which('git') or 'git'
+# Paths per `git add --` call when git predates --pathspec-from-file (< 2.26)
+_GIT_ADD_CHUNK = 500
+
+# GitLab API connection pool: keep-alive connections are reused across calls
+# so only the first request pays the TCP + TLS handshake
+_HTTP_CONNECT_TIMEOUT = 5
+_HTTP_READ_TIMEOUT = 30
+_HTTP_POOL_MAXSIZE = 10
+# Requests in flight at once across threads (override with GITLAB_MAX_CONCURRENT)
+_HTTP_MAX_CONCURRENT = 8
+_HTTP_RETRY_TOTAL = 5
+_HTTP_RETRY_BACKOFF = 0.5
+_HTTP_RETRY_AFTER_MAX = 60
+# A connection that could not be opened sent nothing, so any method may try
+# once more after a short pause; refused and unresolvable hosts fail at once
+# (a wrong GITLAB_URL should not stall doctor)
+_HTTP_CONNECT_RETRY_DELAY = 0.2
+_HTTP_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Once a request is sent, a 5xx or a dropped connection may hide a POST the
+# server already applied, so only idempotent methods retry after that
+_HTTP_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE'})
+# Same-host redirects are followed (e.g. http -> https, a relocated GitLab);
+# 301/302/303 only for GET/HEAD, since other methods would be turned into a GET
+_HTTP_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_HTTP_MAX_REDIRECTS = 5
+# GET responses are reused for this long, then revalidated with If-None-Match
+_HTTP_CACHE_TTL = 60
+
+# Precompiled patterns for branch names, labels and git config sections
+_BRANCH_RE = re.compile(r'^.+/\d+.*$')
+_IID_RE = re.compile(r'/(\d+)')
+_LABEL_SPLIT_RE = re.compile(r'\s*,\s*')
+_REMOTE_SECTION_RE = re.compile(r'^\s*\[remote\s+"((?:[^"\\]|\\.)+)"\s*\]', re.MULTILINE)
+_CONFIG_ESCAPE_RE = re.compile(r'\\(.)')
+# Last get_branch_changes result, kept inside the git directory
+_CHANGES_CACHE_FILE = 'gitlab-workflow-changes.json'
+# Bump when the cached commits/stats change shape or the log/numstat options
+# behind them change; entries written under another version are discarded
+_CHANGES_CACHE_VERSION = 1
+# Conventional commit types stripped from subjects in the MR implementation list
+_CC_PREFIXES = frozenset({'feat', 'fix', 'refactor', 'docs', 'style', 'test', 'chore'})
+# Commit dict keys and the `git log` placeholders that fill them
+_COMMIT_FIELDS = {'hash': '%H', 'subject': '%s', 'body': '%b', 'author': '%an', 'email': '%ae', 'date': '%ad'}
+# Line the interactive helper scripts print to hand back their JSON file
+_JSON_PATH_RE = re.compile(r'^JSON_PATH=(.*)$', re.MULTILINE)
+
+# Branch title sanitization: deletes every ASCII char except alphanumerics and '-'
+_DELETE_TABLE = dict.fromkeys(b for b in range(128) if not (chr(b).isalnum() or chr(b) == '-'))
+
+# MR description layout; blocks are rendered by GitLabWorkflow._render_mr_*_block
+_MR_TEMPLATE = (
+    "{issue_block}"
+    "## 📊 Changes Summary\n\n"
+    "- **Files changed**: {files_changed}\n"
+    "- **Insertions**: +{insertions}\n"
+    "- **Deletions**: -{deletions}\n"
+    "- **Total commits**: {total_commits}\n\n"
+    "{commits_block}"
+)
+_MR_ISSUE_TEMPLATE = (
+    "# 📋 Issue Summary\n\n"
+    "**Issue**: #{iid} - {title}\n"
+    "**Status**: {state}\n"
+    "**Labels**: {labels}\n"
+    "**URL**: {web_url}\n\n"
+    "{requirements}"
+    "## ✅ Implementation (구현 내용)\n\n"
+    "{implementation}"
+)
+_MR_COMMIT_TEMPLATE = (
+    "### {i}. {subject}\n"
+    "- **Commit**: `{short_hash}`\n"
+    "- **Author**: {author}\n"
+    "- **Date**: {date}\n\n"
+    "{body}"
+    "---\n\n"
+)
+
+# KEY=VALUE line in .env.gitlab-workflow (value optionally "double" or 'single' quoted)
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(?:"(.*)"|\'(.*)\'|(.*?))[ \t]*$',
+    re.MULTILINE
+)
+
+# Accepted answers to yes/no confirmation prompts
+_YES = frozenset({'y', 'yes', '예'})
 
 
 # ═══════════════════════════════════════════════════════════════
 # Workflow State Management
 # ═══════════════════════════════════════════════════════════════
 
-@dataclass
+# __slots__ dataclasses (no per-instance __dict__) where supported; Python < 3.10
+# cannot combine hand-written __slots__ with field defaults, so falls back to plain
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class WorkflowState:
     """Track workflow state for atomic rollback on failure"""
 
-    completed_steps: List[str] = field(default_factory=list)
+    completed_steps: Set[str] = field(default_factory=set)
     issue_iid: Optional[int] = None
     branch_name: Optional[str] = None
     original_branch: Optional[str] = None
@@ -44,14 +148,14 @@ class WorkflowState:
 
     def mark(self, step: str) -> None:
         """Mark a step as completed"""
-        self.completed_steps.append(step)
+        self.completed_steps.add(step)
 
     def has(self, step: str) -> bool:
         """Check if a step was completed"""
         return step in self.completed_steps
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WorkflowResult:
     """Result of workflow execution"""
 
@@ -65,11 +169,155 @@ class WorkflowResult:
     error: Optional[str] = None
 
 
+@dataclass(**_DATACLASS_SLOTS)
+class GitSnapshot:
+    """Working tree state from one `git status --porcelain=v2 --branch -z` call"""
+
+    branch: Optional[str] = None  # 'HEAD' when detached, like `rev-parse --abbrev-ref HEAD`
+    dirty_files: List[str] = field(default_factory=list)
+
+
 class WorkflowError(Exception):
     """Raised when forced workflow fails"""
     pass
 
 
+def _find_git_dir(start: Optional[str] = None) -> Optional[Path]:
+    """
+    Locate the git directory without spawning git
+
+    Walks up from start (default: cwd) looking for `.git`, following
+    `gitdir:` pointer files used by worktrees and submodules.
+
+    Returns:
+        Path to the git directory, or None if not found
+    """
+    if os.environ.get('GIT_DIR'):
+        return Path(os.environ['GIT_DIR']).resolve()
+
+    path = Path(start or os.getcwd()).resolve()
+    for directory in (path, *path.parents):
+        dot_git = directory / '.git'
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding='utf-8').strip()
+            except OSError:
+                return None
+            if content.startswith('gitdir:'):
+                return (directory / content[len('gitdir:'):].strip()).resolve()
+            return None
+    return None
+
+
+def _is_git_repo() -> bool:
+    """Check that cwd is inside a git repository, spawning git only if no .git is found"""
+    if _find_git_dir():
+        return True
+    return subprocess.run(
+        [_GIT, 'rev-parse', '--git-dir'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    ).returncode == 0
+
+
+def _config_remotes(git_dir: Path) -> List[str]:
+    """
+    List remotes declared in the repository config file, sorted like `git remote`
+
+    Only the repository's own config is read (the shared one for worktrees),
+    so an empty result means "ask git", not "no remotes".
+    """
+    common_dir = git_dir
+    try:
+        common_dir = (git_dir / (git_dir / 'commondir').read_text(encoding='utf-8').strip()).resolve()
+    except OSError:
+        pass
+    try:
+        config = (common_dir / 'config').read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return []
+    return sorted({_CONFIG_ESCAPE_RE.sub(r'\1', name) for name in _REMOTE_SECTION_RE.findall(config)})
+
+
+def _sanitize_branch_title(title: str) -> str:
+    """
+    Turn an issue title into a lowercase branch name slug of at most 50 chars
+
+    Splits on (Unicode) whitespace, then strips each word down to ASCII
+    alphanumerics and '-' (dropping Korean and other non-ASCII text).
+    Only as many words as fit in 50 chars are translated, however long the title is.
+    """
+    slug = ''
+    for word in title.split():
+        word = word.encode('ascii', 'ignore').decode('ascii').translate(_DELETE_TABLE)
+        if word:
+            slug = f"{slug}-{word}" if slug else word
+            if len(slug) >= 50:
+                break
+    return slug[:50].lower()
+
+
+def _derive_branch_name(issue_code: str, issue_iid: int, title: str) -> str:
+    """Build the {issue-code}/{gitlab#}-{summary} branch name for a new issue"""
+    sanitized_title = _sanitize_branch_title(title)
+
+    # If title becomes empty after sanitization, use issue number only
+    if not sanitized_title or sanitized_title == '-':
+        return f"{issue_code.lower()}/{issue_iid}"
+    return f"{issue_code.lower()}/{issue_iid}-{sanitized_title}"
+
+
+def _normalize_labels(labels) -> List[str]:
+    """Return labels as a list, accepting a list or a comma-separated string"""
+    if not labels:
+        return []
+    if isinstance(labels, str):
+        return [label for label in _LABEL_SPLIT_RE.split(labels.strip()) if label]
+    labels = (str(label).strip() for label in labels)
+    return [label for label in labels if label]
+
+
+def _find_git_root(start: Optional[str] = None) -> Optional[Path]:
+    """
+    Locate the git work tree root, like `git rev-parse --show-toplevel`
+
+    Walks up from start (default: cwd) to the first directory holding a
+    `.git` directory or gitfile; git is only asked when the walk finds none
+    (e.g. GIT_DIR/GIT_WORK_TREE setups). Returns None outside a repository.
+    """
+    path = Path(start or os.getcwd()).resolve()
+    for directory in (path, *path.parents):
+        if (directory / '.git').exists():
+            return directory
+    result = subprocess.run(
+        [_GIT, 'rev-parse', '--show-toplevel'],
+        capture_output=True,
+        text=True
+    )
+    return Path(result.stdout.strip()) if result.returncode == 0 else None
+
+
+def _find_env_file(start: Optional[str] = None) -> Optional[Path]:
+    """
+    Locate .claude/.env.gitlab-workflow without spawning git
+
+    Walks up from start (default: cwd) to the git work tree root and returns
+    the nearest env file, or None when there is none or not inside a git repository.
+    """
+    path = Path(start or os.getcwd()).resolve()
+    found = None
+    for directory in (path, *path.parents):
+        if found is None:
+            candidate = directory / '.claude' / '.env.gitlab-workflow'
+            if candidate.is_file():
+                found = candidate
+        if (directory / '.git').exists():
+            return found
+    return None
+
+
 def run_interactive_script(script_name: str) -> Optional[str]:
     """
     Run interactive script and extract JSON path from output
@@ -81,18 +329,16 @@ def run_interactive_script(script_name: str) -> Optional[str]:
         Path to generated JSON file, or None if failed
     """
     try:
-        # Get script directory (same directory as this file)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        script_path = os.path.join(script_dir, script_name)
+        script_path = _SCRIPT_DIR / script_name
 
         # Check if script exists
-        if not os.path.exists(script_path):
+        if not script_path.exists():
             print(f"Error: Interactive script not found: {script_path}", file=sys.stderr)
             return None
 
         # Run interactive script
         result = subprocess.run(
-            [sys.executable, script_path],
+            [sys.executable, str(script_path)],
             capture_output=True,
             text=True
         )
@@ -104,10 +350,9 @@ def run_interactive_script(script_name: str) -> Optional[str]:
             return None
 
         # Extract JSON_PATH from output
-        for line in result.stdout.split('\n'):
-            if line.startswith('JSON_PATH='):
-                json_path = line.split('=', 1)[1].strip()
-                return json_path
+        match = _JSON_PATH_RE.search(result.stdout)
+        if match:
+            return match.group(1).strip()
 
         print("Error: Could not find JSON_PATH in script output", file=sys.stderr)
         return None
@@ -128,66 +373,30 @@ def load_env_file(env_file_path: str) -> None:
         return
 
     try:
-        with open(env_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
+        text = Path(env_file_path).read_text(encoding='utf-8')
+        # Comments and blank lines never match; quotes are stripped by the pattern
+        parsed = {}
+        for match in _ENV_LINE_RE.finditer(text):
+            key, double_quoted, single_quoted, raw = match.groups()
+            if double_quoted is not None:
+                value = double_quoted
+            elif single_quoted is not None:
+                value = single_quoted
+            else:
+                value = raw
+            parsed.setdefault(key, value)  # first definition wins
 
-                # Parse KEY=VALUE format
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-
-                    # Only set if not already in environment
-                    if key and not os.getenv(key):
-                        os.environ[key] = value
+        # Only set if not already in environment
+        env = os.environ
+        env.update({key: value for key, value in parsed.items() if not env.get(key)})
     except Exception as e:
         print(f"Warning: Failed to load .env file: {e}", file=sys.stderr)
 
 
-def initialize_env_file(env_file_path: str) -> bool:
-    """
-    Initialize GitLab workflow environment with interactive prompts
-
-    Args:
-        env_file_path: Path to .env file to create
-
-    Returns:
-        True if successful, False otherwise
-    """
-    print("🚀 GitLab Workflow Initialization\n")
-    print("This will help you set up GitLab workflow environment.\n")
-
-    # Check if file exists
-    if os.path.exists(env_file_path):
-        print(f"⚠️  Configuration file already exists: {env_file_path}\n")
-
-        # Offer backup option
-        response = input("Do you want to backup and create new configuration? (y/n): ").strip().lower()
-        if response not in ['y', 'yes']:
-            print("❌ Initialization cancelled.")
-            return False
-
-        # Create backup
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_path = f"{env_file_path}.backup.{timestamp}"
-        try:
-            with open(env_file_path, 'r', encoding='utf-8') as src:
-                with open(backup_path, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
-            print(f"✅ Backed up existing configuration to: {backup_path}\n")
-        except Exception as e:
-            print(f"⚠️  Could not create backup: {e}")
-            print("Continuing anyway...\n")
+def _prompt_env_config() -> Dict[str, str]:
+    """Prompt for each setting of the .env file (used by initialize_env_file)"""
+    # Only the init command prompts for a hidden token; keep getpass off the common path
+    import getpass
 
     # Collect required configuration
     print("📋 Required Configuration")
@@ -251,6 +460,111 @@ def initialize_env_file(env_file_path: str) -> bool:
     if not base_branch:
         base_branch = "main"
 
+    return {
+        'gitlab_url': gitlab_url,
+        'gitlab_token': gitlab_token,
+        'gitlab_project': gitlab_project,
+        'gitlab_remote': gitlab_remote,
+        'issue_dir': issue_dir,
+        'base_branch': base_branch,
+    }
+
+
+def _env_config_from_json(config) -> Optional[Dict[str, str]]:
+    """
+    Validate settings given as JSON (init --config-json) with the same rules as the prompts
+
+    Returns:
+        Normalized settings, or None (after printing the problems) if invalid
+    """
+    if not isinstance(config, dict):
+        print("❌ --config-json expects a JSON object", file=sys.stderr)
+        return None
+
+    def value(key: str) -> str:
+        return str(config.get(key) or '').strip()
+
+    gitlab_url = value('gitlab_url').rstrip('/')
+    gitlab_token = value('gitlab_token')
+    gitlab_project = value('gitlab_project')
+
+    errors = []
+    if not gitlab_url.startswith(('http://', 'https://')):
+        errors.append("gitlab_url is required and must start with http:// or https://")
+    if not gitlab_token:
+        errors.append("gitlab_token is required")
+    if '/' not in gitlab_project:
+        errors.append("gitlab_project is required (format: namespace/project-name)")
+    if errors:
+        for error in errors:
+            print(f"❌ {error}", file=sys.stderr)
+        return None
+
+    if not gitlab_token.startswith('glpat-'):
+        print("⚠️  Token doesn't start with 'glpat-'; using it as given")
+
+    return {
+        'gitlab_url': gitlab_url,
+        'gitlab_token': gitlab_token,
+        'gitlab_project': gitlab_project,
+        'gitlab_remote': value('gitlab_remote'),
+        'issue_dir': value('issue_dir') or "docs/requirements",
+        'base_branch': value('base_branch') or "main",
+    }
+
+
+def initialize_env_file(env_file_path: str, config: Optional[Dict] = None) -> bool:
+    """
+    Initialize GitLab workflow environment with interactive prompts
+
+    Args:
+        env_file_path: Path to .env file to create
+        config: Settings to use instead of prompting (init --config-json); an
+            existing file is then backed up without asking
+
+    Returns:
+        True if successful, False otherwise
+    """
+    print("🚀 GitLab Workflow Initialization\n")
+    print("This will help you set up GitLab workflow environment.\n")
+
+    # Validate given settings before touching any existing file
+    if config is not None:
+        config = _env_config_from_json(config)
+        if config is None:
+            return False
+
+    # Check if file exists
+    if os.path.exists(env_file_path):
+        print(f"⚠️  Configuration file already exists: {env_file_path}\n")
+
+        # Offer backup option (given settings mean the caller already chose to replace it)
+        if config is None:
+            response = input("Do you want to backup and create new configuration? (y/n): ").strip().lower()
+            if response not in ['y', 'yes']:
+                print("❌ Initialization cancelled.")
+                return False
+
+        # Create backup
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_path = f"{env_file_path}.backup.{timestamp}"
+        try:
+            # Kernel-side copy; copy2 also keeps the original's 600 permissions on the token file
+            shutil.copy2(env_file_path, backup_path)
+            print(f"✅ Backed up existing configuration to: {backup_path}\n")
+        except Exception as e:
+            print(f"⚠️  Could not create backup: {e}")
+            print("Continuing anyway...\n")
+
+    if config is None:
+        config = _prompt_env_config()
+    gitlab_url = config['gitlab_url']
+    gitlab_token = config['gitlab_token']
+    gitlab_project = config['gitlab_project']
+    gitlab_remote = config['gitlab_remote']
+    issue_dir = config['issue_dir']
+    base_branch = config['base_branch']
+
     # Create .claude directory if needed
     claude_dir = os.path.dirname(env_file_path)
     if not os.path.exists(claude_dir):
@@ -326,7 +640,125 @@ BASE_BRANCH={base_branch}
         return False
 
 
-class GitLabWorkflow:
+class GitWorkflow:
+    """Local git operations that need no GitLab API access"""
+
+    def __init__(self, remote_name: Optional[str] = None):
+        """
+        Initialize git workflow
+
+        Args:
+            remote_name: Git remote name (optional, auto-detects if not provided)
+        """
+        self.remote_name = remote_name
+        self._remote_cache: Optional[str] = None
+
+    def get_remote_name(self) -> str:
+        """
+        Get the primary git remote name
+
+        Returns:
+            Remote name (e.g., 'origin', 'gitlab')
+        """
+        # If remote name is configured, use it
+        if self.remote_name:
+            return self.remote_name
+
+        # Auto-detected remote is resolved once per instance
+        if self._remote_cache:
+            return self._remote_cache
+
+        try:
+            # Read remotes from the repo config in-process; fall back to git
+            # when they live elsewhere (includes, global config)
+            git_dir = _find_git_dir()
+            remotes = _config_remotes(git_dir) if git_dir else []
+            if not remotes:
+                result = subprocess.run(
+                    [_GIT, 'remote'],
+                    check=True,
+                    capture_output=True,
+                    text=True
+                )
+                remotes = result.stdout.split()
+
+            # Prefer 'origin' if exists, otherwise use first remote
+            if 'origin' in remotes:
+                self._remote_cache = 'origin'
+            elif remotes:
+                self._remote_cache = remotes[0]
+            else:
+                raise Exception("No git remote found")
+            return self._remote_cache
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"Failed to get git remote: {e}")
+
+    def get_current_branch(self) -> str:
+        """Get current Git branch name"""
+        # Read HEAD in-process; fall back to git for anything unusual
+        git_dir = _find_git_dir()
+        if git_dir:
+            try:
+                head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+            except OSError:
+                head = ''
+            if head.startswith('ref: refs/heads/'):
+                branch = head[len('ref: refs/heads/'):]
+                if branch != '.invalid':  # reftable placeholder
+                    return branch
+            elif len(head) in (40, 64) and all(c in '0123456789abcdef' for c in head):
+                return 'HEAD'  # detached, same as `rev-parse --abbrev-ref HEAD`
+
+        try:
+            result = subprocess.run(
+                [_GIT, 'rev-parse', '--abbrev-ref', 'HEAD'],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+            return result.stdout.strip()
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"Failed to get current branch: {e}")
+
+    def push_branch(self, branch_name: str, set_upstream: bool = True) -> bool:
+        """
+        Push branch to remote
+
+        Args:
+            branch_name: Name of the branch to push
+            set_upstream: Set upstream tracking (default: True)
+
+        Returns:
+            True if successful
+        """
+        try:
+            # Get remote name
+            remote = self.get_remote_name()
+
+            if set_upstream:
+                subprocess.run(
+                    [_GIT, 'push', '-u', remote, branch_name],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
+            else:
+                subprocess.run(
+                    [_GIT, 'push', remote, branch_name],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
+
+            print(f"✅ Pushed branch: {branch_name}")
+            return True
+
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode('utf-8') if e.stderr else str(e)
+            raise Exception(f"Failed to push branch: {error_msg}")
+
+
+class GitLabWorkflow(GitWorkflow):
     """GitLab workflow automation for issue->branch->MR"""
 
     def __init__(self, gitlab_url: str, token: str, project_id: str, remote_name: Optional[str] = None, issue_dir: Optional[str] = None):
@@ -340,40 +772,259 @@ class GitLabWorkflow:
             remote_name: Git remote name (optional, auto-detects if not provided)
             issue_dir: Directory to save issue.json files (optional)
         """
+        super().__init__(remote_name)
         self.gitlab_url = gitlab_url.rstrip('/')
         self.api_url = f"{self.gitlab_url}/api/v4"
         self.token = token
         self.project_id = project_id
-        self.remote_name = remote_name
-        self.issue_dir = issue_dir
+        # Endpoints are built once with the URL-encoded project id
+        self._project_ep = f"projects/{quote_plus(project_id)}"
+        self._issues_ep = f"{self._project_ep}/issues"
+        self._merge_requests_ep = f"{self._project_ep}/merge_requests"
+        # Environment-derived settings are normalized once here, not per call
+        self.issue_dir = os.path.expanduser(issue_dir) if issue_dir else issue_dir
+        self.base_branch_default = os.getenv('BASE_BRANCH', 'main')
+        # (remote, base branch) pairs already fetched by this instance
+        self._fetched_bases: Set[Tuple[str, str]] = set()
+        # endpoint -> (fetched at, response body, ETag); cleared by any write.
+        # The body is kept as bytes and parsed per hit, so every caller gets
+        # its own objects and mutating one cannot change later results
+        self._api_cache: Dict[str, Tuple[float, bytes, Optional[str]]] = {}
+        # Working tree snapshot, reused until a mutating git op bumps the epoch
+        self._status_cache: Optional[GitSnapshot] = None
+        self._status_cache_epoch = -1
+        self._status_epoch = 0
+        self._branch_cache: Optional[Tuple[int, str]] = None
+        # Progress lines queued by _say, written per workflow phase by _flush
+        self._out: List[str] = []
         self.headers = {
             'PRIVATE-TOKEN': token,
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip'
         }
 
+        # HTTP connection pool (reused across API calls)
+        self._api = urlsplit(self.api_url)
+        self._connections = queue.LifoQueue(maxsize=_HTTP_POOL_MAXSIZE)
+        try:
+            max_concurrent = int(os.environ.get('GITLAB_MAX_CONCURRENT', _HTTP_MAX_CONCURRENT))
+        except ValueError:
+            max_concurrent = _HTTP_MAX_CONCURRENT
+        self._request_slots = threading.BoundedSemaphore(max(1, max_concurrent))
+        # Proxy per URL scheme: (proxy URL, Proxy-Authorization headers) or None
+        self._proxies: Dict[str, Optional[Tuple[Any, Dict[str, str]]]] = {}
+
+    def _proxy_for(self, scheme: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """Return the HTTP(S)_PROXY for a scheme and the headers that authenticate to it"""
+        if scheme not in self._proxies:
+            # The network stack (urllib.request -> http.client -> email) is only
+            # imported once an API client is used; help/init never pay for it
+            import urllib.request
+            proxy = urllib.request.getproxies().get(scheme)
+            if proxy and self._api.hostname and not urllib.request.proxy_bypass(self._api.hostname):
+                proxy_url = urlsplit(proxy if '://' in proxy else f'http://{proxy}')
+                auth_headers = {}
+                if proxy_url.username:
+                    import base64
+                    credentials = f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+                    token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+                    auth_headers['Proxy-Authorization'] = f'Basic {token}'
+                self._proxies[scheme] = (proxy_url, auth_headers)
+            else:
+                self._proxies[scheme] = None
+        return self._proxies[scheme]
+
+    def _new_connection(self, origin=None) -> 'http.client.HTTPConnection':
+        """Open a new connection to the GitLab host (directly or via HTTP(S)_PROXY)"""
+        origin = origin or self._api
+        if origin.scheme not in ('http', 'https') or not origin.hostname:
+            raise Exception(f"Invalid GitLab URL: {self.gitlab_url!r}")
+
+        import http.client
+        conn_class = http.client.HTTPSConnection if origin.scheme == 'https' else http.client.HTTPConnection
+        proxy = self._proxy_for(origin.scheme)
+        if proxy:
+            proxy_url, auth_headers = proxy
+            conn = conn_class(proxy_url.hostname, proxy_url.port, timeout=_HTTP_CONNECT_TIMEOUT)
+            if origin.scheme == 'https':
+                conn.set_tunnel(origin.hostname, origin.port, headers=auth_headers)
+        else:
+            conn = conn_class(origin.hostname, origin.port, timeout=_HTTP_CONNECT_TIMEOUT)
+
+        conn.connect()
+        conn.sock.settimeout(_HTTP_READ_TIMEOUT)
+        return conn
+
+    def _acquire_connection(self) -> 'http.client.HTTPConnection':
+        """Take an idle connection from the pool, or open a new one"""
+        while True:
+            try:
+                conn = self._connections.get_nowait()
+            except queue.Empty:
+                return self._new_connection()
+
+            # Server closed the idle connection (EOF readable) - discard it
+            if conn.sock is None or select.select([conn.sock], [], [], 0)[0]:
+                conn.close()
+                continue
+            return conn
+
+    def _release_connection(self, conn: 'http.client.HTTPConnection', response: 'http.client.HTTPResponse') -> None:
+        """Return a connection to the pool if the server allows keep-alive"""
+        if response.will_close:
+            conn.close()
+            return
+        try:
+            self._connections.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _open(self, origin) -> 'http.client.HTTPConnection':
+        """
+        Get a connected connection for an origin
+
+        The configured GitLab origin uses the keep-alive pool; a redirect to
+        another scheme or port of the same host gets its own connection.
+        """
+        if origin is self._api:
+            return self._acquire_connection()
+        return self._new_connection(origin)
+
+    def _send(self, conn: 'http.client.HTTPConnection', origin, method: str, path: str,
+              body: Optional[bytes], headers: Dict[str, str]):
+        """
+        Send one request on a connection from _open and read the whole response
+
+        Returns (response, payload) with gzip already decoded.
+        """
+        import gzip
+
+        proxy = self._proxy_for(origin.scheme)
+        if proxy and origin.scheme == 'http':
+            # Plain-HTTP proxies expect the absolute URL in the request line
+            # and read their credentials from the request headers
+            path = f"{origin.scheme}://{origin.netloc}{path}"
+            headers = dict(headers, **proxy[1])
+
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            payload = response.read()
+            if payload and response.getheader('Content-Encoding', '').lower() == 'gzip':
+                payload = gzip.decompress(payload)
+        except BaseException:
+            conn.close()
+            raise
+
+        if origin is self._api:
+            self._release_connection(conn, response)
+        else:
+            conn.close()
+        return response, payload
+
     def _make_request(
         self,
         endpoint: str,
         method: str = 'GET',
         data: Optional[Dict] = None
     ):
-        """Make HTTP request to GitLab API"""
-        url = f"{self.api_url}/{endpoint}"
-        req_data = json.dumps(data).encode('utf-8') if data else None
-        request = urllib.request.Request(url, data=req_data, headers=self.headers, method=method)
-
-        try:
-            with urllib.request.urlopen(request) as response:
-                if response.status == 204:
-                    return None
-                return json.loads(response.read().decode('utf-8'))
-        except urllib.error.HTTPError as e:
-            error_msg = e.read().decode('utf-8')
+        """Make HTTP request to GitLab API over a pooled keep-alive connection"""
+        import http.client
+        import socket
+
+        origin = self._api
+        path = f"{self._api.path}/{endpoint}"
+        req_data = json.dumps(data, separators=(',', ':')).encode('utf-8') if data else None
+        headers = self.headers
+        cached = self._api_cache.get(endpoint) if method == 'GET' else None
+        if cached:
+            if time.monotonic() - cached[0] < _HTTP_CACHE_TTL:
+                return json.loads(cached[1])
+            if cached[2]:
+                headers = dict(self.headers, **{'If-None-Match': cached[2]})
+        sent_retries = _HTTP_RETRY_TOTAL if method in _HTTP_IDEMPOTENT_METHODS else 0
+
+        # Threads beyond the cap wait here instead of opening more connections
+        with self._request_slots:
+            reconnected = False
+            for redirects in range(_HTTP_MAX_REDIRECTS + 1):
+                for attempt in range(_HTTP_RETRY_TOTAL + 1):
+                    try:
+                        conn = self._open(origin)
+                    except (ConnectionRefusedError, socket.gaierror):
+                        raise
+                    except (http.client.HTTPException, OSError):
+                        if reconnected:
+                            raise
+                        reconnected = True
+                        time.sleep(_HTTP_CONNECT_RETRY_DELAY)
+                        continue
+
+                    try:
+                        response, payload = self._send(conn, origin, method, path, req_data, headers)
+                    except (http.client.HTTPException, OSError):
+                        if attempt < sent_retries:
+                            time.sleep(_HTTP_RETRY_BACKOFF * (2 ** attempt))
+                            continue
+                        raise
+
+                    if response.status in _HTTP_RETRY_STATUSES and attempt < sent_retries:
+                        time.sleep(self._retry_delay(response, attempt))
+                        continue
+                    break
+
+                # Follow same-host redirects; anything else is reported below
+                location = response.getheader('Location')
+                if (response.status not in _HTTP_REDIRECT_STATUSES or not location
+                        or redirects == _HTTP_MAX_REDIRECTS):
+                    break
+                if method not in ('GET', 'HEAD') and response.status not in (307, 308):
+                    break
+                target = urlsplit(urljoin(f"{origin.scheme}://{origin.netloc}{path}", location))
+                if target.scheme not in ('http', 'https') or target.hostname != self._api.hostname:
+                    break
+                same_origin = (target.scheme, target.port) == (self._api.scheme, self._api.port)
+                origin = self._api if same_origin else target
+                path = f"{target.path}?{target.query}" if target.query else target.path
+
+        if response.status == 304 and cached:
+            self._api_cache[endpoint] = (time.monotonic(), cached[1], cached[2])
+            return json.loads(cached[1])
+
+        if response.status >= 300:
+            error_msg = payload.decode('utf-8', 'replace')
+            if 300 <= response.status < 400:
+                error_msg = f"Redirected to {response.getheader('Location')} (check GITLAB_URL)"
             try:
                 error_data = json.loads(error_msg)
-                raise Exception(f"GitLab API Error ({e.code}): {error_data}")
+                raise Exception(f"GitLab API Error ({response.status}): {error_data}")
             except json.JSONDecodeError:
-                raise Exception(f"GitLab API Error ({e.code}): {error_msg}")
+                raise Exception(f"GitLab API Error ({response.status}): {error_msg}")
+
+        if method != 'GET':
+            self._api_cache.clear()
+        if response.status == 204 or not payload:
+            return None
+        if method == 'GET':
+            self._api_cache[endpoint] = (time.monotonic(), payload, response.getheader('ETag'))
+        return json.loads(payload)  # bytes in: no separate decode copy
+
+    @staticmethod
+    def _retry_delay(response: 'http.client.HTTPResponse', attempt: int) -> float:
+        """Seconds to wait before retrying: honor Retry-After (429/503), else exponential backoff"""
+        retry_after = response.getheader('Retry-After')
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                from email.utils import parsedate_to_datetime
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), _HTTP_RETRY_AFTER_MAX)
+        return _HTTP_RETRY_BACKOFF * (2 ** attempt)
 
     def validate_branch_name(self, branch_name: str) -> bool:
         """
@@ -387,24 +1038,32 @@ class GitLabWorkflow:
         """
         # Pattern: VTM-1372/307-feature-name or 1372/307-feature-name
         # Issue code part can be any string, GitLab part must be a number
-        pattern = r'^.+/\d+.*$'
-        return bool(re.match(pattern, branch_name, re.IGNORECASE))
+        if '\n' in branch_name:
+            return bool(_BRANCH_RE.match(branch_name))
+
+        # Fast path without the regex engine: any non-leading '/' followed by a digit
+        slash = branch_name.find('/', 1)
+        while slash != -1:
+            if branch_name[slash + 1:slash + 2].isdecimal():
+                return True
+            slash = branch_name.find('/', slash + 1)
+        return False
 
     def create_issue(
         self,
         title: str,
         description: Optional[str] = None,
-        labels: Optional[str] = None
+        labels: Optional[List[str]] = None
     ) -> Dict:
         """Create GitLab issue"""
         data = {'title': title}
         if description:
             data['description'] = description
         if labels:
-            data['labels'] = labels
+            data['labels'] = ','.join(labels) if isinstance(labels, list) else labels
 
         issue = self._make_request(
-            f"projects/{quote_plus(self.project_id)}/issues",
+            self._issues_ep,
             method='POST',
             data=data
         )
@@ -438,10 +1097,11 @@ class GitLabWorkflow:
             data['labels'] = ','.join(labels) if isinstance(labels, list) else labels
 
         issue = self._make_request(
-            f"projects/{quote_plus(self.project_id)}/issues/{issue_iid}",
+            f"{self._issues_ep}/{issue_iid}",
             method='PUT',
             data=data
         )
+        self.invalidate_issue(issue_iid)
         return issue
 
     def get_issue(self, issue_iid: int) -> Dict:
@@ -452,13 +1112,49 @@ class GitLabWorkflow:
             issue_iid: GitLab issue IID
             
         Returns:
-            Issue data
+            Issue data (reused from the GET cache until the issue is updated)
         """
-        issue = self._make_request(
-            f"projects/{quote_plus(self.project_id)}/issues/{issue_iid}",
+        return self._make_request(
+            f"{self._issues_ep}/{issue_iid}",
             method='GET'
         )
-        return issue
+
+    def invalidate_issue(self, issue_iid: int) -> None:
+        """Drop a cached issue so the next get_issue() refetches it"""
+        self._api_cache.pop(f"{self._issues_ep}/{issue_iid}", None)
+
+    def _snapshot(self) -> GitSnapshot:
+        """Return branch and dirty files from one git status call, cached until the status epoch changes"""
+        if self._status_cache_epoch != self._status_epoch:
+            # Read-only: don't let status take index.lock to refresh the index
+            # while other git commands may be running concurrently
+            result = subprocess.run(
+                [_GIT, 'status', '--porcelain=v2', '--branch', '-z'],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=dict(os.environ, GIT_OPTIONAL_LOCKS='0')
+            )
+            snapshot = GitSnapshot()
+            records = iter(result.stdout.split('\0'))
+            for record in records:
+                kind = record[:1]
+                if kind == '#':
+                    if record.startswith('# branch.head '):
+                        head = record[len('# branch.head '):]
+                        snapshot.branch = 'HEAD' if head == '(detached)' else head
+                elif kind == '1':    # 1 XY sub mH mI mW hH hI path
+                    snapshot.dirty_files.append(record.split(' ', 8)[8])
+                elif kind == '2':    # 2 XY sub mH mI mW hH hI Xscore path, then origPath record
+                    snapshot.dirty_files.append(record.split(' ', 9)[9])
+                    next(records, None)
+                elif kind == 'u':    # u XY sub m1 m2 m3 mW h1 h2 h3 path
+                    snapshot.dirty_files.append(record.split(' ', 10)[10])
+                elif kind == '?':    # ? path
+                    snapshot.dirty_files.append(record[2:])
+            self._status_cache = snapshot
+            self._status_cache_epoch = self._status_epoch
+        return self._status_cache
 
     def is_working_directory_clean(self) -> bool:
         """
@@ -468,14 +1164,7 @@ class GitLabWorkflow:
             True if clean, False if dirty
         """
         try:
-            result = subprocess.run(
-                ['git', 'status', '--porcelain'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            # If output is empty, working directory is clean
-            return len(result.stdout.strip()) == 0
+            return not self._snapshot().dirty_files
         except subprocess.CalledProcessError:
             return False
 
@@ -487,21 +1176,18 @@ class GitLabWorkflow:
             List of file paths with changes
         """
         try:
-            result = subprocess.run(
-                ['git', 'status', '--porcelain'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            files = []
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    # Format: "XY filename"
-                    files.append(line[3:])  # Skip status code
-            return files
+            return list(self._snapshot().dirty_files)
         except subprocess.CalledProcessError:
             return []
 
+    def get_current_branch(self) -> str:
+        """Get current Git branch name, cached until the status epoch changes"""
+        if self._status_cache_epoch == self._status_epoch and self._status_cache.branch:
+            return self._status_cache.branch
+        if self._branch_cache is None or self._branch_cache[0] != self._status_epoch:
+            self._branch_cache = (self._status_epoch, super().get_current_branch())
+        return self._branch_cache[1]
+
     def commit_current_changes(self, commit_message: Optional[str] = None) -> bool:
         """
         Commit all current changes to current branch
@@ -516,20 +1202,43 @@ class GitLabWorkflow:
             # Get current branch for context
             current_branch = self.get_current_branch()
 
+            dirty_files = self.get_dirty_files()
+
             # Auto-generate commit message if not provided
             if not commit_message:
-                dirty_files = self.get_dirty_files()
                 file_count = len(dirty_files)
                 commit_message = f"WIP: Auto-commit {file_count} file(s) before workflow operation"
 
-            # Add all changes
-            subprocess.run(['git', 'add', '.'], check=True, capture_output=True)
+            # Add exactly the changed paths (status paths are repo-root relative, hence :(top))
+            # instead of letting `git add .` rescan the tree
+            self._status_epoch += 1
+            if dirty_files:
+                pathspecs = [f':(top,literal){f}' for f in dirty_files]
+                result = subprocess.run(
+                    [_GIT, 'add', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                    input=''.join(f'{spec}\0' for spec in pathspecs).encode('utf-8'),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
+                if result.returncode == 129:
+                    # Usage error: git < 2.26 has no --pathspec-from-file, so
+                    # pass the paths as arguments, a chunk at a time
+                    for i in range(0, len(pathspecs), _GIT_ADD_CHUNK):
+                        subprocess.run(
+                            [_GIT, 'add', '--'] + pathspecs[i:i + _GIT_ADD_CHUNK],
+                            check=True,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE
+                        )
+                elif result.returncode != 0:
+                    raise subprocess.CalledProcessError(result.returncode, result.args, stderr=result.stderr)
 
             # Commit
             subprocess.run(
-                ['git', 'commit', '-m', commit_message],
+                [_GIT, 'commit', '-m', commit_message],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
 
             print(f"✅ Committed changes to {current_branch}")
@@ -554,10 +1263,12 @@ class GitLabWorkflow:
             if not stash_message:
                 stash_message = "Auto-stash for workflow operation"
 
+            self._status_epoch += 1
             subprocess.run(
-                ['git', 'stash', 'push', '-m', stash_message],
+                [_GIT, 'stash', 'push', '-m', stash_message],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
 
             print(f"✅ Stashed changes: {stash_message}")
@@ -567,6 +1278,44 @@ class GitLabWorkflow:
             error_msg = e.stderr.decode('utf-8') if e.stderr else str(e)
             raise Exception(f"Failed to stash changes: {error_msg}")
 
+    def move_changes_to_branch(self, branch_name: str, commit_message: str) -> bool:
+        """
+        Commit tracked changes onto a new branch and clean the working tree, without switching branches
+
+        `git stash create` snapshots the changes without touching the index or
+        working tree; the snapshot's tree is committed on top of HEAD and
+        branched, then the working tree is reset. Untracked files stay in
+        place, as with `git stash push`.
+
+        Args:
+            branch_name: Branch to create with the changes
+            commit_message: Message for the WIP commit
+
+        Returns:
+            True if successful
+        """
+        try:
+            stash_sha = subprocess.run(
+                [_GIT, 'stash', 'create', commit_message],
+                check=True, capture_output=True, text=True
+            ).stdout.strip()
+            if not stash_sha:
+                raise Exception("No tracked changes to move (untracked files are left in place)")
+
+            commit_sha = subprocess.run(
+                [_GIT, 'commit-tree', f'{stash_sha}^{{tree}}', '-p', 'HEAD', '-m', commit_message],
+                check=True, capture_output=True, text=True
+            ).stdout.strip()
+            subprocess.run([_GIT, 'branch', branch_name, commit_sha], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+            self._status_epoch += 1
+            subprocess.run([_GIT, 'reset', '--hard', '--quiet', 'HEAD'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            return True
+
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr or str(e)
+            raise Exception(f"Failed to move changes to {branch_name}: {error_msg}")
+
     def pop_stash(self) -> bool:
         """
         Pop most recent stash
@@ -575,7 +1324,8 @@ class GitLabWorkflow:
             True if successful
         """
         try:
-            subprocess.run(['git', 'stash', 'pop'], check=True, capture_output=True)
+            self._status_epoch += 1
+            subprocess.run([_GIT, 'stash', 'pop'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             print(f"✅ Applied stashed changes")
             return True
 
@@ -666,7 +1416,8 @@ class GitLabWorkflow:
         print(f"   1. Commit to current branch (Recommended)")
         print(f"      → Add all → Commit → Create MR with these changes")
         print(f"   2. Move to temporary branch")
-        print(f"      → Stash → Create temp branch → Apply stash → MR without these changes")
+        print(f"      → Commit tracked changes to a temp branch (without switching) → MR without these changes")
+        print(f"        Untracked files stay in the working tree")
         print(f"   3. Cancel")
 
         while True:
@@ -688,30 +1439,17 @@ class GitLabWorkflow:
                     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                     temp_branch = f"temp/{current_branch}_wip_{timestamp}"
 
-                    # Stash changes
-                    self.stash_changes(f"Auto-stash for MR creation")
-
-                    # Create temp branch from current
-                    subprocess.run(
-                        ['git', 'checkout', '-b', temp_branch],
-                        check=True,
-                        capture_output=True
-                    )
-
-                    # Apply stash
-                    self.pop_stash()
+                    # Commit the changes onto the temp branch without checking it out
+                    self.move_changes_to_branch(temp_branch, f"WIP: changes moved aside for MR from {current_branch}")
 
                     print(f"✅ Created temporary branch: {temp_branch}")
-                    print(f"   Changes are now in temp branch")
-
-                    # Switch back to original branch
-                    subprocess.run(
-                        ['git', 'checkout', current_branch],
-                        check=True,
-                        capture_output=True
-                    )
-
-                    print(f"✅ Switched back to: {current_branch} (now clean)")
+                    print(f"   Tracked changes are now committed in temp branch")
+                    # Only untracked files can be left after the reset
+                    untracked = self.get_dirty_files()
+                    if untracked:
+                        print(f"✅ Staying on: {current_branch} ({len(untracked)} untracked file(s) left in working tree)")
+                    else:
+                        print(f"✅ Staying on: {current_branch} (now clean)")
                     print(f"   Temp branch '{temp_branch}' has your WIP changes")
 
                     return 'move_to_temp'
@@ -778,26 +1516,35 @@ class GitLabWorkflow:
                 remote_name = self.get_remote_name()
                 remote_ref = f'{remote_name}/{ref}'
 
-            # Fetch latest changes from the remote
+            # Fetch only the base branch into its remote-tracking ref; the ref check runs
+            # meanwhile and is only repeated if the ref did not exist before the fetch
             print(f"🔄 Fetching latest changes from {remote_name}...")
-            subprocess.run(['git', 'fetch', remote_name], check=True, capture_output=True)
+            base_name = remote_ref.split('/', 1)[1]
+            fetch = subprocess.Popen(
+                [_GIT, 'fetch', '--no-tags', remote_name, f'+refs/heads/{base_name}:refs/remotes/{remote_ref}'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            verify_cmd = [_GIT, 'rev-parse', '--quiet', '--verify', remote_ref]
+            ref_exists = subprocess.run(verify_cmd, stdout=subprocess.DEVNULL).returncode == 0
+            _, fetch_err = fetch.communicate()
+            if fetch.returncode != 0:
+                raise subprocess.CalledProcessError(fetch.returncode, fetch.args, stderr=fetch_err)
 
             # Verify that the remote ref exists
-            verify_result = subprocess.run(
-                ['git', 'rev-parse', '--verify', remote_ref],
-                capture_output=True,
-                text=True
-            )
-            if verify_result.returncode != 0:
+            if not ref_exists:
+                ref_exists = subprocess.run(verify_cmd, stdout=subprocess.DEVNULL).returncode == 0
+            if not ref_exists:
                 raise Exception(
                     f"Remote branch '{remote_ref}' not found\n"
                     f"Available remote branches:\n"
                     f"  git branch -r\n"
                 )
 
-            # Create and checkout new branch from remote ref
-            subprocess.run(['git', 'checkout', '-b', branch_name, remote_ref],
-                         check=True, capture_output=True)
+            # Create and switch to the new branch; --no-track so it doesn't adopt the base as upstream
+            self._status_epoch += 1
+            subprocess.run([_GIT, 'checkout', '--no-track', '-b', branch_name, remote_ref],
+                         check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
             print(f"✅ Created branch: {branch_name}")
             print(f"   Based on: {remote_ref}")
@@ -807,41 +1554,6 @@ class GitLabWorkflow:
             error_msg = e.stderr.decode('utf-8') if e.stderr else str(e)
             raise Exception(f"Failed to create branch: {error_msg}")
 
-    def push_branch(self, branch_name: str, set_upstream: bool = True) -> bool:
-        """
-        Push branch to remote
-
-        Args:
-            branch_name: Name of the branch to push
-            set_upstream: Set upstream tracking (default: True)
-
-        Returns:
-            True if successful
-        """
-        try:
-            # Get remote name
-            remote = self.get_remote_name()
-
-            if set_upstream:
-                subprocess.run(
-                    ['git', 'push', '-u', remote, branch_name],
-                    check=True,
-                    capture_output=True
-                )
-            else:
-                subprocess.run(
-                    ['git', 'push', remote, branch_name],
-                    check=True,
-                    capture_output=True
-                )
-
-            print(f"✅ Pushed branch: {branch_name}")
-            return True
-
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode('utf-8') if e.stderr else str(e)
-            raise Exception(f"Failed to push branch: {error_msg}")
-
     def save_issue_json(
         self,
         issue_iid: int,
@@ -885,10 +1597,9 @@ class GitLabWorkflow:
             "push": pushed
         }
         
-        # Save to file
+        # Save to file (encoded in full first, then written once)
         json_file = issue_path / "issue.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(issue_data, f, ensure_ascii=False, indent=2)
+        json_file.write_text(json.dumps(issue_data, ensure_ascii=False, indent=2), encoding='utf-8')
         
         return str(json_file)
 
@@ -930,7 +1641,8 @@ class GitLabWorkflow:
         if current_branch != source_branch:
             print(f"⚠️  Current branch ({current_branch}) differs from source branch ({source_branch})")
             print(f"   Switching to {source_branch}...")
-            subprocess.run(['git', 'checkout', source_branch], check=True, capture_output=True)
+            self._status_epoch += 1
+            subprocess.run([_GIT, 'checkout', source_branch], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
         # Handle dirty working directory
         action = self.handle_dirty_working_directory_for_mr()
@@ -974,101 +1686,105 @@ class GitLabWorkflow:
             data['description'] = full_description
 
         mr = self._make_request(
-            f"projects/{quote_plus(self.project_id)}/merge_requests",
+            self._merge_requests_ep,
             method='POST',
             data=data
         )
         return mr
 
-    def get_remote_name(self) -> str:
-        """
-        Get the primary git remote name
-
-        Returns:
-            Remote name (e.g., 'origin', 'gitlab')
-        """
-        # If remote name is configured, use it
-        if self.remote_name:
-            return self.remote_name
-
-        try:
-            # Get all remotes
-            result = subprocess.run(
-                ['git', 'remote'],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            remotes = result.stdout.strip().split('\n')
-
-            # Prefer 'origin' if exists, otherwise use first remote
-            if 'origin' in remotes:
-                return 'origin'
-            elif remotes:
-                return remotes[0]
-            else:
-                raise Exception("No git remote found")
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Failed to get git remote: {e}")
-
-    def get_current_branch(self) -> str:
-        """Get current Git branch name"""
+    def _fetch_remote_base(self, base_branch: str, force: bool = False) -> None:
+        """Fetch latest base branch so remote-relative comparisons are up to date (once per instance unless forced)"""
+        remote = self.get_remote_name()
+        key = (remote, base_branch)
+        if key in self._fetched_bases and not force:
+            return
+        self._fetched_bases.add(key)
         try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Failed to get current branch: {e}")
+            # Only the base branch's tracking ref, no tags; output is never shown, so don't pipe it
+            subprocess.run([_GIT, 'fetch', '--no-tags', remote,
+                            f'+refs/heads/{base_branch}:refs/remotes/{remote}/{base_branch}'],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        except subprocess.CalledProcessError:
+            # If fetch fails, continue with local comparison
+            pass
 
-    def get_branch_commits(self, branch_name: str, base_branch: str = 'main') -> List[Dict]:
+    def get_branch_commits(
+        self,
+        branch_name: str,
+        base_branch: str = 'main',
+        fetch: bool = True,
+        fields: Optional[Iterable[str]] = None,
+        force_fetch: bool = False
+    ) -> List[Dict]:
         """Get commit history for a branch compared to remote base branch"""
-        try:
-            # Use remote base branch to ensure we only get commits from current branch work
-            remote = self.get_remote_name()
-            remote_base = f'{remote}/{base_branch}'
+        return list(self.iter_branch_commits(branch_name, base_branch, fetch, fields, force_fetch))
 
-            # Fetch latest to ensure we have up-to-date remote refs
-            try:
-                subprocess.run(['git', 'fetch', remote, base_branch],
-                             capture_output=True, check=True)
-            except subprocess.CalledProcessError:
-                # If fetch fails, continue with local comparison
-                pass
-
-            result = subprocess.run(
-                ['git', 'log', f'{remote_base}..{branch_name}', '--format=%H%n%s%n%b%n%an%n%ae%n%ad%n---COMMIT---'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            commits = []
-            commit_texts = result.stdout.strip().split('---COMMIT---')
-            
-            for commit_text in commit_texts:
-                if not commit_text.strip():
-                    continue
-                    
-                lines = commit_text.strip().split('\n')
-                if len(lines) < 6:
-                    continue
-
-                commits.append({
-                    'hash': lines[0],
-                    'subject': lines[1],
-                    'body': '\n'.join(lines[2:-3]).strip(),
-                    'author': lines[-3],
-                    'email': lines[-2],
-                    'date': lines[-1]
-                })
-            
-            return commits
-            
-        except subprocess.CalledProcessError as e:
+    def iter_branch_commits(
+        self,
+        branch_name: str,
+        base_branch: str = 'main',
+        fetch: bool = True,
+        fields: Optional[Iterable[str]] = None,
+        force_fetch: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Stream commit history for a branch compared to remote base branch
+
+        Commits are parsed as `git log` writes them, so callers that only
+        need a single pass never hold the whole log in memory.
+        The base branch is fetched at most once per instance; pass fetch=False
+        to skip it, or force_fetch=True to fetch again.
+        Pass fields (keys of _COMMIT_FIELDS) to have git emit only those;
+        merge commits are skipped.
+        """
+        # Use remote base branch to ensure we only get commits from current branch work
+        remote = self.get_remote_name()
+        remote_base = f'{remote}/{base_branch}'
+
+        # Fetch latest to ensure we have up-to-date remote refs
+        if fetch or force_fetch:
+            self._fetch_remote_base(base_branch, force_fetch)
+
+        names = tuple(fields) if fields else tuple(_COMMIT_FIELDS)
+        placeholders = '%x00'.join(_COMMIT_FIELDS[name] for name in names)
+
+        # NUL-separated fields with -z: no sentinel that a commit message could collide with
+        cmd = [_GIT, 'log', '-z', '--no-merges', f'{remote_base}..{branch_name}', f'--format={placeholders}']
+        # Read raw bytes and decode per commit: git emits UTF-8 log output, and a
+        # stray invalid byte in one message must not abort the whole log
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        finished = False
+        try:
+            values = []
+            pending = b''
+            for chunk in iter(lambda: proc.stdout.read(65536), b''):
+                parts = (pending + chunk).split(b'\0')
+                # Last part is an incomplete field (or b'' after a trailing NUL)
+                pending = parts.pop()
+                values.extend(parts)
+
+                while len(values) >= len(names):
+                    commit = {name: value.decode('utf-8', 'replace') for name, value in zip(names, values)}
+                    del values[:len(names)]
+                    if 'body' in commit:
+                        commit['body'] = commit['body'].strip()
+                    yield commit
+            finished = True
+        finally:
+            proc.stdout.close()
+            if not finished:
+                # Consumer stopped early: don't wait for git to write the rest
+                proc.kill()
+            stderr = proc.stderr.read()
+            proc.stderr.close()
+            proc.wait()
+
+        if proc.returncode != 0:
+            e = subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
             raise Exception(f"Failed to get branch commits: {e}")
 
     def get_branch_diff_stats(self, branch_name: str, base_branch: str = 'main') -> Dict:
@@ -1079,63 +1795,120 @@ class GitLabWorkflow:
             remote_base = f'{remote}/{base_branch}'
 
             result = subprocess.run(
-                ['git', 'diff', '--shortstat', f'{remote_base}...{branch_name}'],
+                [_GIT, 'diff', '--numstat', f'{remote_base}...{branch_name}'],
                 capture_output=True,
                 text=True,
                 check=True
             )
-            
-            output = result.stdout.strip()
+
             stats = {'files_changed': 0, 'insertions': 0, 'deletions': 0}
-            
-            if output:
-                files_match = re.search(r'(\d+) files? changed', output)
-                insertions_match = re.search(r'(\d+) insertions?\(\+\)', output)
-                deletions_match = re.search(r'(\d+) deletions?\(-\)', output)
-                
-                if files_match:
-                    stats['files_changed'] = int(files_match.group(1))
-                if insertions_match:
-                    stats['insertions'] = int(insertions_match.group(1))
-                if deletions_match:
-                    stats['deletions'] = int(deletions_match.group(1))
-            
+
+            # One "insertions<TAB>deletions<TAB>path" line per file; binary files show "-"
+            for line in result.stdout.splitlines():
+                added, deleted, _ = line.split('\t', 2)
+                stats['files_changed'] += 1
+                if added != '-':
+                    stats['insertions'] += int(added)
+                    stats['deletions'] += int(deleted)
+
             return stats
             
         except subprocess.CalledProcessError as e:
             raise Exception(f"Failed to get diff stats: {e}")
 
-    def generate_requirements_summary(self, branch_name: str, base_branch: str = 'main') -> str:
-        """Generate summary focused on requirements and changes to be made (not results)"""
-        commits = self.get_branch_commits(branch_name, base_branch)
-        
-        summary_parts = [
-            f"# 브랜치: {branch_name}\n",
-            "## 📋 변경 예정 사항\n"
-        ]
+    def get_branch_changes(self, branch_name: str, base_branch: str = 'main') -> Tuple[List[Dict], Dict]:
+        """
+        Get commit history and diff statistics for a branch in one call
+
+        The base branch is fetched once, then `git log` and `git diff --numstat`
+        run concurrently against the same remote ref. The result depends only on
+        the two tip commits, so the last one is kept in the git directory and
+        reused while neither tip has moved and its format version matches.
+
+        Returns:
+            (commits, stats) as returned by get_branch_commits / get_branch_diff_stats
+        """
+        self._fetch_remote_base(base_branch)
+
+        cache_key = self._branch_changes_key(branch_name, base_branch)
+        git_dir = _find_git_dir() if cache_key else None
+        cache_file = git_dir / _CHANGES_CACHE_FILE if git_dir else None
+        if cache_file:
+            try:
+                cached = json.loads(cache_file.read_bytes())
+                if cached.get('version') == _CHANGES_CACHE_VERSION and cached['key'] == cache_key:
+                    return cached['commits'], cached['stats']
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            commits_future = executor.submit(self.get_branch_commits, branch_name, base_branch, False)
+            stats_future = executor.submit(self.get_branch_diff_stats, branch_name, base_branch)
+            commits, stats = commits_future.result(), stats_future.result()
+
+        if cache_file:
+            try:
+                cache_file.write_text(
+                    json.dumps({
+                        'version': _CHANGES_CACHE_VERSION,
+                        'key': cache_key,
+                        'commits': commits,
+                        'stats': stats
+                    }, ensure_ascii=False),
+                    encoding='utf-8'
+                )
+            except OSError:
+                pass  # Cache is best effort
+        return commits, stats
+
+    def _branch_changes_key(self, branch_name: str, base_branch: str) -> Optional[str]:
+        """Return 'base_sha..branch_sha' for the remote base and branch, or None if either is missing"""
+        result = subprocess.run(
+            [_GIT, 'rev-parse', f'{self.get_remote_name()}/{base_branch}^{{commit}}', f'{branch_name}^{{commit}}'],
+            capture_output=True,
+            text=True
+        )
+        shas = result.stdout.split()
+        if result.returncode != 0 or len(shas) != 2:
+            return None
+        return '..'.join(shas)
+
+    def generate_requirements_summary(
+        self,
+        branch_name: str,
+        base_branch: str = 'main',
+        commits: Optional[Iterable[Dict]] = None
+    ) -> str:
+        """
+        Generate summary focused on requirements and changes to be made (not results)
+
+        Pass commits (with subject and body) when the caller already has them;
+        otherwise the branch log is streamed.
+        """
+        if commits is None:
+            commits = self.iter_branch_commits(branch_name, base_branch, fields=('subject', 'body'))
+        buf = io.StringIO()
+        buf.write(f"# 브랜치: {branch_name}\n\n")
+        buf.write("## 📋 변경 예정 사항\n\n")
         
-        if commits:
-            # 커밋 메시지에서 요구사항과 변경 사항 추출
-            for i, commit in enumerate(commits, 1):
-                subject = commit['subject']
-                body = commit['body']
-                
-                # feat:, fix:, refactor: 등의 conventional commit prefix 제거
-                clean_subject = subject
-                if ':' in subject:
-                    parts = subject.split(':', 1)
-                    if len(parts) == 2:
-                        clean_subject = parts[1].strip()
-                
-                summary_parts.append(f"### {i}. {clean_subject}")
-                
-                if body:
-                    # 본문이 있으면 포함
-                    summary_parts.append(f"{body}\n")
-                
-                summary_parts.append("---\n")
+        # 커밋 메시지에서 요구사항과 변경 사항 추출
+        for i, commit in enumerate(commits, 1):
+            subject = commit['subject']
+            body = commit['body']
+            
+            # feat:, fix:, refactor: 등의 conventional commit prefix 제거
+            _, sep, rest = subject.partition(':')
+            clean_subject = rest.strip() if sep else subject
+            
+            buf.write(f"### {i}. {clean_subject}\n")
+            
+            if body:
+                # 본문이 있으면 포함
+                buf.write(f"{body}\n\n")
+            
+            buf.write("---\n\n")
         
-        return '\n'.join(summary_parts)
+        return buf.getvalue()
     
     def generate_mr_summary(self, branch_name: str, base_branch: str = 'main', issue_iid: Optional[int] = None) -> str:
         """
@@ -1149,74 +1922,76 @@ class GitLabWorkflow:
         Returns:
             Formatted MR description with issue summary, requirements, and implementation
         """
-        commits = self.get_branch_commits(branch_name, base_branch)
-        stats = self.get_branch_diff_stats(branch_name, base_branch)
-
-        summary_parts = []
+        # The issue lookup is independent of git - overlap its round trip with the fetch/log
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            issue_future = executor.submit(self.get_issue, issue_iid) if issue_iid else None
+            commits, stats = self.get_branch_changes(branch_name, base_branch)
 
         # Add Issue Summary section if issue_iid is provided
-        if issue_iid:
+        issue_block = ''
+        if issue_future:
             try:
-                issue = self.get_issue(issue_iid)
-                summary_parts.extend([
-                    f"# 📋 Issue Summary\n",
-                    f"**Issue**: #{issue_iid} - {issue['title']}",
-                    f"**Status**: {issue.get('state', 'N/A')}",
-                    f"**Labels**: {', '.join(issue.get('labels', [])) or 'None'}",
-                    f"**URL**: {issue['web_url']}\n"
-                ])
-
-                # Add Requirements section from issue description
-                if issue.get('description'):
-                    summary_parts.extend([
-                        "## 📝 Requirements (요구사항)\n",
-                        issue['description'],
-                        "\n"
-                    ])
-
-                # Add Implementation Summary section
-                summary_parts.append("## ✅ Implementation (구현 내용)\n")
-                if commits:
-                    summary_parts.append("### 주요 구현 사항:\n")
-                    for i, commit in enumerate(commits, 1):
-                        # Extract clean commit message (remove conventional commit prefix)
-                        subject = commit['subject']
-                        if ':' in subject:
-                            parts = subject.split(':', 1)
-                            if len(parts) == 2 and parts[0].strip() in ['feat', 'fix', 'refactor', 'docs', 'style', 'test', 'chore']:
-                                subject = parts[1].strip()
-
-                        summary_parts.append(f"{i}. {subject}")
-                    summary_parts.append("\n")
-
+                issue_block = self._render_mr_issue_block(issue_future.result(), issue_iid, commits)
             except Exception as e:
                 # If issue fetch fails, continue without issue info
                 print(f"⚠️  Could not fetch issue #{issue_iid}: {e}")
 
-        # Add Changes Summary section
-        summary_parts.extend([
-            "## 📊 Changes Summary\n",
-            f"- **Files changed**: {stats['files_changed']}",
-            f"- **Insertions**: +{stats['insertions']}",
-            f"- **Deletions**: -{stats['deletions']}",
-            f"- **Total commits**: {len(commits)}\n"
-        ])
-
-        # Add detailed Commit History section
+        return _MR_TEMPLATE.format_map({
+            'issue_block': issue_block,
+            'files_changed': stats['files_changed'],
+            'insertions': stats['insertions'],
+            'deletions': stats['deletions'],
+            'total_commits': len(commits),
+            'commits_block': self._render_mr_commits_block(commits),
+        })
+
+    @staticmethod
+    def _render_mr_issue_block(issue: Dict, issue_iid: int, commits: List[Dict]) -> str:
+        """Render issue summary, requirements and implementation sections of the MR description"""
+        requirements = ''
+        if issue.get('description'):
+            requirements = f"## 📝 Requirements (요구사항)\n\n{issue['description']}\n\n\n"
+
+        implementation = ''
         if commits:
-            summary_parts.append("## 📜 Detailed Commit History\n")
-            for i, commit in enumerate(commits, 1):
-                summary_parts.append(f"### {i}. {commit['subject']}")
-                summary_parts.append(f"- **Commit**: `{commit['hash'][:8]}`")
-                summary_parts.append(f"- **Author**: {commit['author']}")
-                summary_parts.append(f"- **Date**: {commit['date']}\n")
-
-                if commit['body']:
-                    summary_parts.append(f"{commit['body']}\n")
-
-                summary_parts.append("---\n")
-
-        return '\n'.join(summary_parts)
+            subjects = []
+            for commit in commits:
+                # Extract clean commit message (remove conventional commit prefix)
+                subject = commit['subject']
+                prefix, sep, rest = subject.partition(':')
+                if sep and prefix.strip() in _CC_PREFIXES:
+                    subject = rest.strip()
+                subjects.append(subject)
+            implementation = "### 주요 구현 사항:\n\n" + ''.join(
+                f"{i}. {subject}\n" for i, subject in enumerate(subjects, 1)
+            ) + "\n\n"
+
+        return _MR_ISSUE_TEMPLATE.format_map({
+            'iid': issue_iid,
+            'title': issue['title'],
+            'state': issue.get('state', 'N/A'),
+            'labels': ', '.join(issue.get('labels', [])) or 'None',
+            'web_url': issue['web_url'],
+            'requirements': requirements,
+            'implementation': implementation,
+        })
+
+    @staticmethod
+    def _render_mr_commits_block(commits: List[Dict]) -> str:
+        """Render the detailed commit history section of the MR description"""
+        if not commits:
+            return ''
+        return "## 📜 Detailed Commit History\n\n" + ''.join(
+            _MR_COMMIT_TEMPLATE.format_map({
+                'i': i,
+                'subject': commit['subject'],
+                'short_hash': commit['hash'][:8],
+                'author': commit['author'],
+                'date': commit['date'],
+                'body': f"{commit['body']}\n\n" if commit['body'] else '',
+            })
+            for i, commit in enumerate(commits, 1)
+        )
 
     def update_issue_from_branch(
         self,
@@ -1231,7 +2006,7 @@ class GitLabWorkflow:
         
         # Extract issue IID from branch name if not provided
         if not issue_iid:
-            match = re.search(r'/(\d+)', branch_name)
+            match = _IID_RE.search(branch_name)
             if match:
                 issue_iid = int(match.group(1))
                 print(f"📌 Extracted issue IID from branch: #{issue_iid}")
@@ -1241,21 +2016,19 @@ class GitLabWorkflow:
         print(f"📊 Analyzing branch: {branch_name}")
         print(f"   Base branch: {base_branch}")
         
-        summary = self.generate_requirements_summary(branch_name, base_branch)
+        # The title needs the log too: read it once and share it with the summary
+        commits = self.get_branch_commits(branch_name, base_branch, fields=('subject', 'body')) if update_title else None
+        summary = self.generate_requirements_summary(branch_name, base_branch, commits)
         current_issue = self.get_issue(issue_iid)
         
         update_data = {'description': summary}
         
         if update_title:
-            commits = self.get_branch_commits(branch_name, base_branch)
             if commits:
                 # Remove conventional commit prefix
                 subject = commits[0]['subject']
-                if ':' in subject:
-                    parts = subject.split(':', 1)
-                    if len(parts) == 2:
-                        subject = parts[1].strip()
-                update_data['title'] = subject
+                _, sep, rest = subject.partition(':')
+                update_data['title'] = rest.strip() if sep else subject
         
         print(f"\n📝 Updating GitLab issue #{issue_iid}...")
         updated_issue = self.update_issue(issue_iid=issue_iid, **update_data)
@@ -1274,39 +2047,43 @@ class GitLabWorkflow:
         """
         print("🏥 Running GitLab Workflow Doctor...\n")
         results = {}
-        all_passed = True
+
+        # GitLab API probes and git probes are independent: fire them together up
+        # front so they overlap each other; results are reported in order below
+        executor = ThreadPoolExecutor(max_workers=6)
+        project_future = executor.submit(self._make_request, self._project_ep)
+        issues_future = executor.submit(
+            self._make_request, self._issues_ep + "?per_page=1"
+        )
+        user_future = executor.submit(self._make_request, "user")
+        git_dir_future = executor.submit(_is_git_repo)
+        remote_future = executor.submit(self._get_remote_url)
+        dirty_future = executor.submit(self.get_dirty_files)
+        executor.shutdown(wait=False)
         
         # Check 1: Environment variables
         print("📋 Checking environment variables...")
-        env_checks = {
-            'GITLAB_URL': bool(self.gitlab_url),
-            'GITLAB_TOKEN': bool(self.token),
-            'GITLAB_PROJECT': bool(self.project_id),
-        }
-        
-        for key, value in env_checks.items():
-            status = "✅" if value else "❌"
-            print(f"   {status} {key}: {'Set' if value else 'Missing'}")
-            if not value:
-                all_passed = False
-        
-        results['environment'] = all(env_checks.values())
+        env_ok = True
+        for key, value in (('GITLAB_URL', self.gitlab_url), ('GITLAB_TOKEN', self.token), ('GITLAB_PROJECT', self.project_id)):
+            if value:
+                print(f"   ✅ {key}: Set")
+            else:
+                print(f"   ❌ {key}: Missing")
+                env_ok = False
+
+        all_passed = env_ok
+        results['environment'] = env_ok
         
         # Check 2: Git repository
         print("\n📦 Checking Git repository...")
         try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--git-dir'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            print("   ✅ Git repository: Found")
-            results['git_repo'] = True
-        except subprocess.CalledProcessError:
-            print("   ❌ Git repository: Not found (not in a git repository)")
-            results['git_repo'] = False
-            all_passed = False
+            if git_dir_future.result():
+                print("   ✅ Git repository: Found")
+                results['git_repo'] = True
+            else:
+                print("   ❌ Git repository: Not found (not in a git repository)")
+                results['git_repo'] = False
+                all_passed = False
         except FileNotFoundError:
             print("   ❌ Git command: Not found (git not installed)")
             results['git_repo'] = False
@@ -1314,15 +2091,8 @@ class GitLabWorkflow:
         
         # Check 3: Git remote
         print("\n🌐 Checking Git remote...")
-        try:
-            remote_name = self.get_remote_name()
-            result = subprocess.run(
-                ['git', 'remote', 'get-url', remote_name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            remote_url = result.stdout.strip()
+        try:
+            remote_name, remote_url = remote_future.result()
             print(f"   ✅ Git remote '{remote_name}': {remote_url}")
             results['git_remote'] = True
         except subprocess.CalledProcessError:
@@ -1339,7 +2109,7 @@ class GitLabWorkflow:
         print("\n🔌 Checking GitLab API connectivity...")
         try:
             # Try to get project info
-            project = self._make_request(f"projects/{quote_plus(self.project_id)}")
+            project = project_future.result()
             print(f"   ✅ GitLab API: Connected")
             print(f"   ✅ Project: {project.get('name_with_namespace', 'N/A')}")
             print(f"   ✅ URL: {project.get('web_url', 'N/A')}")
@@ -1356,13 +2126,11 @@ class GitLabWorkflow:
             try:
                 # Try to create a test issue (dry run - we won't actually create it)
                 # Just check if we can access the issues endpoint
-                issues = self._make_request(
-                    f"projects/{quote_plus(self.project_id)}/issues?per_page=1"
-                )
+                issues_future.result()
                 print("   ✅ Token permissions: Valid (can read issues)")
                 
                 # Check if token has write permissions by checking user
-                user = self._make_request("user")
+                user = user_future.result()
                 print(f"   ✅ Token user: {user.get('username', 'N/A')}")
                 results['gitlab_token'] = True
             except Exception as e:
@@ -1379,7 +2147,7 @@ class GitLabWorkflow:
         # Check 6: Issue directory (optional)
         print("\n📁 Checking issue directory...")
         if self.issue_dir:
-            issue_dir_path = os.path.expanduser(self.issue_dir)
+            issue_dir_path = self.issue_dir
             if os.path.exists(issue_dir_path):
                 print(f"   ✅ Issue directory: {issue_dir_path}")
                 results['issue_dir'] = True
@@ -1395,12 +2163,11 @@ class GitLabWorkflow:
         print("\n🔍 Checking working directory status...")
         if results.get('git_repo', False):
             try:
-                is_clean = self.is_working_directory_clean()
-                if is_clean:
+                dirty_files = dirty_future.result()
+                if not dirty_files:
                     print("   ✅ Working directory: Clean (no uncommitted changes)")
                     results['working_dir_clean'] = True
                 else:
-                    dirty_files = self.get_dirty_files()
                     print(f"   ⚠️  Working directory: Has uncommitted changes ({len(dirty_files)} files)")
                     print("   💡 Commit or stash changes before creating new branches:")
                     print("      git add . && git commit -m 'message'")
@@ -1430,6 +2197,17 @@ class GitLabWorkflow:
         
         return results
 
+    def _get_remote_url(self) -> Tuple[str, str]:
+        """Return (remote name, remote URL) for the doctor's remote check"""
+        remote_name = self.get_remote_name()
+        result = subprocess.run(
+            [_GIT, 'remote', 'get-url', remote_name],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return remote_name, result.stdout.strip()
+
     def rollback(self, state: WorkflowState) -> None:
         """
         Rollback workflow to previous state based on completed steps
@@ -1440,35 +2218,36 @@ class GitLabWorkflow:
         - Delete local branch (if created)
         - Switch back to original branch
         - Restore stash (if stashed and not yet popped)
+
+        The remote branch deletion is a network round trip that touches no
+        local state, so it runs in the background and is reported last.
         """
         print("\n🔄 Rolling back changes...")
 
+        # Step 4: Delete remote branch if pushed (started first, awaited at the end)
+        delete_remote = None
+        if state.has('pushed') and state.branch_name:
+            remote_name = self.get_remote_name()
+            delete_remote = subprocess.Popen(
+                [_GIT, 'push', remote_name, '--delete', state.branch_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+
         # Step 5: If stash was popped, re-stash it
         if state.has('stash_popped'):
             try:
                 subprocess.run(
-                    ['git', 'stash', 'push', '-m', 'Rollback: re-stashing changes'],
+                    [_GIT, 'stash', 'push', '-m', 'Rollback: re-stashing changes'],
                     check=True,
-                    capture_output=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
                 print("   ✅ Re-stashed changes")
             except subprocess.CalledProcessError:
                 print("   ⚠️  Could not re-stash changes (may have conflicts)")
                 print("      Your changes may be in working directory")
 
-        # Step 4: Delete remote branch if pushed
-        if state.has('pushed') and state.branch_name:
-            try:
-                remote_name = self.get_remote_name()
-                subprocess.run(
-                    ['git', 'push', remote_name, '--delete', state.branch_name],
-                    check=True,
-                    capture_output=True
-                )
-                print(f"   ✅ Deleted remote branch: {remote_name}/{state.branch_name}")
-            except subprocess.CalledProcessError:
-                print(f"   ⚠️  Could not delete remote branch (may not exist)")
-
         # Step 3: Delete local branch if created
         if state.has('branch_created') and state.branch_name:
             try:
@@ -1476,16 +2255,19 @@ class GitLabWorkflow:
                 current_branch = self.get_current_branch()
                 if current_branch == state.branch_name:
                     switch_to = state.original_branch or 'main'
+                    self._status_epoch += 1
                     subprocess.run(
-                        ['git', 'checkout', switch_to],
+                        [_GIT, 'checkout', switch_to],
                         check=True,
-                        capture_output=True
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL
                     )
 
                 subprocess.run(
-                    ['git', 'branch', '-D', state.branch_name],
+                    [_GIT, 'branch', '-D', state.branch_name],
                     check=True,
-                    capture_output=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
                 print(f"   ✅ Deleted local branch: {state.branch_name}")
             except subprocess.CalledProcessError:
@@ -1497,9 +2279,10 @@ class GitLabWorkflow:
                 current_branch = self.get_current_branch()
                 if current_branch != state.original_branch:
                     subprocess.run(
-                        ['git', 'checkout', state.original_branch],
+                        [_GIT, 'checkout', state.original_branch],
                         check=True,
-                        capture_output=True
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL
                     )
                     print(f"   ✅ Switched back to: {state.original_branch}")
             except subprocess.CalledProcessError:
@@ -1508,14 +2291,33 @@ class GitLabWorkflow:
         # Step 1: Pop stash if it was stashed but not yet popped
         if state.has('stashed') and not state.has('stash_popped'):
             try:
-                subprocess.run(['git', 'stash', 'pop'], check=True, capture_output=True)
+                subprocess.run([_GIT, 'stash', 'pop'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 print("   ✅ Restored stashed changes")
             except subprocess.CalledProcessError:
                 print("   ⚠️  Could not pop stash (changes may be in stash list)")
                 print("      Run 'git stash list' to see stashed changes")
 
+        if delete_remote:
+            if delete_remote.wait() == 0:
+                print(f"   ✅ Deleted remote branch: {remote_name}/{state.branch_name}")
+            else:
+                print(f"   ⚠️  Could not delete remote branch (may not exist)")
+
+        self._status_epoch += 1
         print("   Rollback completed\n")
 
+    def _say(self, message: str = '') -> None:
+        """Queue a line of workflow progress output until the next _flush"""
+        self._out.append(message)
+
+    def _flush(self) -> None:
+        """Write queued progress output with a single write"""
+        if self._out:
+            self._out.append('')
+            sys.stdout.write('\n'.join(self._out))
+            self._out.clear()
+        sys.stdout.flush()
+
     def forced_workflow(
         self,
         json_file_path: str,
@@ -1542,19 +2344,23 @@ class GitLabWorkflow:
             WorkflowError: If workflow fails after rollback
         """
         state = WorkflowState()
+        prefetch = None
+        update_future = None
 
         try:
             # ═══════════════════════════════════════════════════════
             # STEP 0: Validation Phase
             # ═══════════════════════════════════════════════════════
-            print("🔍 Phase 0: Pre-flight validation\n")
+            self._say("🔍 Phase 0: Pre-flight validation\n")
+            self._flush()
 
-            # 0-1. Load and validate JSON
-            if not os.path.exists(json_file_path):
+            # 0-1. Load and validate JSON (json.loads detects UTF-8/16/32 from the raw bytes)
+            try:
+                issue_data = json.loads(Path(json_file_path).read_bytes())
+            except FileNotFoundError:
                 raise FileNotFoundError(f"JSON file not found: {json_file_path}")
-
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                issue_data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in {json_file_path}: {e}")
 
             # Validate required fields
             required_fields = ['issueCode', 'title']
@@ -1562,203 +2368,251 @@ class GitLabWorkflow:
                 if field not in issue_data:
                     raise ValueError(f"Required field missing in JSON: {field}")
 
-            print(f"   ✅ Loaded JSON: {json_file_path}")
-            print(f"      Issue Code: {issue_data['issueCode']}")
-            print(f"      Title: {issue_data['title']}")
+            # Labels may be a list or a comma-separated string; keep one list form from here on
+            labels = _normalize_labels(issue_data.get('labels'))
+
+            self._say(f"   ✅ Loaded JSON: {json_file_path}")
+            self._say(f"      Issue Code: {issue_data['issueCode']}")
+            self._say(f"      Title: {issue_data['title']}")
             state.mark('json_loaded')
 
             # 0-2. Use base branch from .env (forced)
             if not base_branch:
-                base_branch = os.getenv('BASE_BRANCH', 'main')
-            print(f"   ✅ Base branch: {base_branch} (from .env)")
+                base_branch = self.base_branch_default
+            self._say(f"   ✅ Base branch: {base_branch} (from .env)")
 
             # 0-3. Validate git repository
-            try:
-                subprocess.run(
-                    ['git', 'rev-parse', '--git-dir'],
-                    check=True,
-                    capture_output=True
-                )
-                print("   ✅ Git repository validated")
-            except subprocess.CalledProcessError:
+            if not _is_git_repo():
                 raise WorkflowError("Not in a git repository")
+            self._say("   ✅ Git repository validated")
 
             # 0-4. Validate remote
             remote_name = self.get_remote_name()
-            print(f"   ✅ Remote: {remote_name}")
+            self._say(f"   ✅ Remote: {remote_name}")
 
-            # 0-5. Validate remote base branch exists
+            # 0-5. Validate remote base branch exists, noting whether a local
+            # base branch exists too; the working tree status Phase 2 needs is
+            # independent, so take it while for-each-ref runs
             remote_base = f"{remote_name}/{base_branch}"
-            try:
-                subprocess.run(
-                    ['git', 'rev-parse', '--verify', remote_base],
-                    check=True,
-                    capture_output=True
-                )
-                print(f"   ✅ Remote branch exists: {remote_base}")
-            except subprocess.CalledProcessError:
+            remote_ref = f'refs/remotes/{remote_base}'
+            local_ref = f'refs/heads/{base_branch}'
+            verify = subprocess.Popen(
+                [_GIT, 'for-each-ref', '--format=%(refname)', remote_ref, local_ref],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            self.is_working_directory_clean()  # cached until a git op changes the tree
+            found_refs = set(verify.communicate()[0].splitlines())
+            if remote_ref not in found_refs:
                 raise WorkflowError(f"Remote branch not found: {remote_base}")
+            self._say(f"   ✅ Remote branch exists: {remote_base}")
 
-            print("\n✅ All pre-flight checks passed\n")
+            self._say("\n✅ All pre-flight checks passed\n")
 
             # ═══════════════════════════════════════════════════════
             # STEP 1: Create GitLab Issue
             # ═══════════════════════════════════════════════════════
-            print("📝 Phase 1: Creating GitLab issue\n")
+            self._say("📝 Phase 1: Creating GitLab issue\n")
+            self._flush()
+
+            # Download the base branch while the issue is created, so Phase 2
+            # finds nothing left to transfer. Only the remote-tracking ref is
+            # written here; the local base branch is left alone until Phase 2.
+            # Auto gc/maintenance is off so it cannot repack refs underneath
+            # the stash and checkout below
+            prefetch = subprocess.Popen(
+                [_GIT, '-c', 'gc.auto=0', '-c', 'maintenance.auto=false',
+                 'fetch', '--no-tags', remote_name, f'+{local_ref}:{remote_ref}'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
 
             issue = self.create_issue(
                 title=issue_data['title'],
                 description=issue_data.get('description', ''),
-                labels=','.join(issue_data['labels']) if issue_data.get('labels') else None
+                labels=labels
             )
             issue_iid = issue['iid']
             state.issue_iid = issue_iid
             state.mark('issue_created')
 
-            print(f"✅ Created issue #{issue_iid}: {issue['title']}")
-            print(f"   URL: {issue['web_url']}\n")
+            self._say(f"✅ Created issue #{issue_iid}: {issue['title']}")
+            self._say(f"   URL: {issue['web_url']}\n")
 
             # ═══════════════════════════════════════════════════════
             # STEP 2: Auto-handle Dirty Working Directory (FORCED)
             # ═══════════════════════════════════════════════════════
-            print("🔄 Phase 2: Preparing working directory\n")
+            self._say("🔄 Phase 2: Preparing working directory\n")
+            self._flush()
 
             # 2-1. Check if dirty
             is_dirty = not self.is_working_directory_clean()
 
             if is_dirty:
                 dirty_files = self.get_dirty_files()
-                print(f"   ⚠️  Found {len(dirty_files)} uncommitted change(s)")
+                self._say(f"   ⚠️  Found {len(dirty_files)} uncommitted change(s)")
                 for f in dirty_files[:5]:
-                    print(f"      - {f}")
+                    self._say(f"      - {f}")
                 if len(dirty_files) > 5:
-                    print(f"      ... and {len(dirty_files) - 5} more")
+                    self._say(f"      ... and {len(dirty_files) - 5} more")
 
                 # 2-2. FORCED: Stash changes
-                print("\n   📦 Auto-stashing changes...")
+                self._say("\n   📦 Auto-stashing changes...")
                 stash_message = f"Auto-stash for issue #{issue_iid}"
+                self._status_epoch += 1
                 subprocess.run(
-                    ['git', 'stash', 'push', '-m', stash_message],
+                    [_GIT, 'stash', 'push', '-m', stash_message],
                     check=True,
-                    capture_output=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
                 )
                 state.stashed = True
                 state.stashed_files = dirty_files
                 state.mark('stashed')
-                print(f"   ✅ Stashed: {stash_message}")
+                self._say(f"   ✅ Stashed: {stash_message}")
             else:
-                print("   ✅ Working directory is clean")
+                self._say("   ✅ Working directory is clean")
                 state.stashed = False
 
             # 2-3. FORCED: Switch to base branch
             current_branch = self.get_current_branch()
             state.original_branch = current_branch
 
-            print(f"\n   🔀 Switching to {base_branch}...")
-            subprocess.run(
-                ['git', 'checkout', base_branch],
-                check=True,
-                capture_output=True
-            )
+            # When the local base branch exists and is not checked out,
+            # fast-forward it to the prefetched commit first (a local fetch
+            # refuses a diverged base), so the checkout lands on the latest
+            # commit directly and there is nothing left to pull
+            fast_forwarded = False
+            if (prefetch.wait() == 0 and local_ref in found_refs
+                    and current_branch != base_branch):
+                fast_forwarded = subprocess.run(
+                    [_GIT, 'fetch', '--no-tags', '.', f'{remote_ref}:{local_ref}'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                ).returncode == 0
+
+            self._say(f"\n   🔀 Switching to {base_branch}...")
+            if current_branch != base_branch:
+                self._status_epoch += 1
+                subprocess.run(
+                    [_GIT, 'checkout', base_branch],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
             state.mark('switched_to_base')
-            print(f"   ✅ Now on {base_branch}")
+            self._say(f"   ✅ Now on {base_branch}")
 
             # 2-4. FORCED: Pull latest changes
-            print(f"\n   ⬇️  Pulling latest changes from {remote_name}/{base_branch}...")
-            subprocess.run(
-                ['git', 'pull', remote_name, base_branch],
-                check=True,
-                capture_output=True
-            )
+            self._say(f"\n   ⬇️  Pulling latest changes from {remote_name}/{base_branch}...")
+            if not fast_forwarded:
+                # pull reports any fetch problem the prefetch ran into itself
+                self._status_epoch += 1
+                subprocess.run(
+                    [_GIT, 'pull', remote_name, base_branch],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
             state.mark('pulled_latest')
-            print("   ✅ Updated to latest")
+            self._say("   ✅ Updated to latest")
 
             # ═══════════════════════════════════════════════════════
             # STEP 3: Create New Branch
             # ═══════════════════════════════════════════════════════
-            print("\n🌿 Phase 3: Creating new branch\n")
+            self._say("\n🌿 Phase 3: Creating new branch\n")
+            self._flush()
 
             # 3-1. Generate branch name
-            sanitized_title = re.sub(r'[^a-zA-Z0-9\s-]', '', issue_data['title'])
-            sanitized_title = re.sub(r'\s+', '-', sanitized_title.strip())
-            sanitized_title = sanitized_title[:50].lower()
-
-            if not sanitized_title or sanitized_title == '-':
-                branch_name = f"{issue_data['issueCode'].lower()}/{issue_iid}"
-            else:
-                branch_name = f"{issue_data['issueCode'].lower()}/{issue_iid}-{sanitized_title}"
+            branch_name = _derive_branch_name(issue_data['issueCode'], issue_iid, issue_data['title'])
 
             state.branch_name = branch_name
-            print(f"   Branch: {branch_name}")
+            self._say(f"   Branch: {branch_name}")
 
             # 3-2. Create and checkout new branch
+            self._status_epoch += 1
             subprocess.run(
-                ['git', 'checkout', '-b', branch_name],
+                [_GIT, 'checkout', '-b', branch_name],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             state.mark('branch_created')
-            print(f"   ✅ Created and checked out: {branch_name}")
+            self._say(f"   ✅ Created and checked out: {branch_name}")
 
             # ═══════════════════════════════════════════════════════
             # STEP 4: FORCED Push to Remote
             # ═══════════════════════════════════════════════════════
-            print("\n📤 Phase 4: Pushing to remote\n")
+            self._say("\n📤 Phase 4: Pushing to remote\n")
+            self._flush()
 
             subprocess.run(
-                ['git', 'push', '-u', remote_name, branch_name],
+                [_GIT, 'push', '-u', remote_name, branch_name],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             state.mark('pushed')
-            print(f"   ✅ Pushed: {remote_name}/{branch_name}")
+            self._say(f"   ✅ Pushed: {remote_name}/{branch_name}")
+
+            # The Phase 6 issue update depends only on the issue and the stashed
+            # file list, so once the push has succeeded send it and let it overlap
+            # the stash pop; its result is still reported in Phase 6
+            if state.stashed and state.stashed_files:
+                # This is a placeholder - actual AI analysis would be done by Claude Code
+                # For now, we'll update with a structured summary
+                requirements_summary = self._generate_requirements_from_changes(
+                    files=state.stashed_files,
+                    original_title=issue_data['title'],
+                    original_description=issue_data.get('description', '')
+                )
+                executor = ThreadPoolExecutor(max_workers=1)
+                update_future = executor.submit(
+                    self.update_issue, issue_iid=issue_iid, description=requirements_summary
+                )
+                executor.shutdown(wait=False)
 
             # ═══════════════════════════════════════════════════════
             # STEP 5: FORCED Restore Stashed Changes
             # ═══════════════════════════════════════════════════════
             if state.stashed:
-                print("\n📦 Phase 5: Restoring stashed changes\n")
+                self._say("\n📦 Phase 5: Restoring stashed changes\n")
+                self._flush()
 
+                self._status_epoch += 1
                 subprocess.run(
-                    ['git', 'stash', 'pop'],
+                    [_GIT, 'stash', 'pop'],
                     check=True,
-                    capture_output=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
                 )
                 state.mark('stash_popped')
-                print("   ✅ Applied stashed changes to new branch")
+                self._say("   ✅ Applied stashed changes to new branch")
 
             # ═══════════════════════════════════════════════════════
             # STEP 6: AI Auto-Update Issue (FORCED)
             # ═══════════════════════════════════════════════════════
-            print("\n🤖 Phase 6: AI analyzing and updating issue\n")
+            self._say("\n🤖 Phase 6: AI analyzing and updating issue\n")
+            self._flush()
 
             ai_updated = False
-            if state.stashed and state.stashed_files:
-                print(f"   📊 Analyzing {len(state.stashed_files)} changed files...")
-
-                # This is a placeholder - actual AI analysis would be done by Claude Code
-                # For now, we'll update with a structured summary
-                requirements_summary = self._generate_requirements_from_changes(
-                    files=state.stashed_files,
-                    original_title=issue_data['title'],
-                    original_description=issue_data.get('description', '')
-                )
+            if update_future:
+                self._say(f"   📊 Analyzing {len(state.stashed_files)} changed files...")
 
-                # Update issue with requirements summary
-                updated_issue = self.update_issue(
-                    issue_iid=issue_iid,
-                    description=requirements_summary
-                )
+                # Update issue with requirements summary (sent after the push)
+                update_future.result()
 
-                print(f"   ✅ Updated issue #{issue_iid} with requirements summary")
+                self._say(f"   ✅ Updated issue #{issue_iid} with requirements summary")
                 ai_updated = True
             else:
-                print("   ⏭️  No changes to analyze, keeping original issue content")
+                self._say("   ⏭️  No changes to analyze, keeping original issue content")
 
             # ═══════════════════════════════════════════════════════
             # STEP 7: Save issue.json
             # ═══════════════════════════════════════════════════════
-            print("\n💾 Phase 7: Saving metadata\n")
+            self._say("\n💾 Phase 7: Saving metadata\n")
+            self._flush()
 
             json_path = self.save_issue_json(
                 issue_iid=issue_iid,
@@ -1766,26 +2620,30 @@ class GitLabWorkflow:
                 branch_name=branch_name,
                 issue_title=issue_data['title'],
                 issue_description=issue_data.get('description', ''),
-                labels=issue_data.get('labels', []),
+                labels=labels,
                 pushed=True
             )
 
             if json_path:
-                print(f"   ✅ Saved: {json_path}")
+                self._say(f"   ✅ Saved: {json_path}")
 
             # ═══════════════════════════════════════════════════════
             # SUCCESS
             # ═══════════════════════════════════════════════════════
-            print("\n" + "="*60)
-            print("✅ Workflow completed successfully!")
-            print("="*60)
-            print(f"Issue:  #{issue_iid} - {issue_data['title']}")
-            print(f"Branch: {branch_name}")
-            print(f"Status: Pushed to {remote_name}/{branch_name}")
-            print(f"URL:    {issue['web_url']}")
+            lines = [
+                "\n" + "="*60,
+                "✅ Workflow completed successfully!",
+                "="*60,
+                f"Issue:  #{issue_iid} - {issue_data['title']}",
+                f"Branch: {branch_name}",
+                f"Status: Pushed to {remote_name}/{branch_name}",
+                f"URL:    {issue['web_url']}",
+            ]
             if ai_updated:
-                print(f"AI:     Issue updated with requirements summary")
-            print("="*60 + "\n")
+                lines.append("AI:     Issue updated with requirements summary")
+            lines.append("="*60 + "\n")
+            self._say('\n'.join(lines))
+            self._flush()
 
             return WorkflowResult(
                 success=True,
@@ -1801,9 +2659,29 @@ class GitLabWorkflow:
             # ═══════════════════════════════════════════════════════
             # ROLLBACK on Failure
             # ═══════════════════════════════════════════════════════
+            self._flush()
             print(f"\n❌ Error: {e}")
 
+            # An issue update already in flight cannot be recalled; wait for it
+            # so its outcome is reported alongside the rollback
+            update_error = None
+            if update_future:
+                try:
+                    update_future.result()
+                except Exception as update_exc:
+                    update_error = update_exc
+
+            # Let the background fetch finish writing refs (and reap it)
+            # before rollback stashes and checks out in the same repository
+            if prefetch:
+                prefetch.wait()
+
             self.rollback(state)
+            if update_future:
+                if update_error:
+                    print(f"⚠️  Issue #{state.issue_iid} update also failed: {update_error}")
+                else:
+                    print(f"⚠️  Issue #{state.issue_iid} description was already updated before the failure")
 
             print("="*60)
             print("❌ Workflow failed and rolled back")
@@ -1838,12 +2716,10 @@ class GitLabWorkflow:
         ]
 
         # Group files by directory
-        file_groups = {}
+        file_groups = defaultdict(list)
         for f in files:
-            dir_name = os.path.dirname(f) or '.'
-            if dir_name not in file_groups:
-                file_groups[dir_name] = []
-            file_groups[dir_name].append(os.path.basename(f))
+            dir_name, file_name = os.path.split(f)
+            file_groups[dir_name or '.'].append(file_name)
 
         for dir_name, file_list in sorted(file_groups.items()):
             summary_parts.append(f"\n### {dir_name}/")
@@ -1861,7 +2737,7 @@ class GitLabWorkflow:
         issue_code: str,
         issue_description: Optional[str] = None,
         branch_name: Optional[str] = None,
-        labels: Optional[str] = None,
+        labels: Optional[List[str]] = None,
         base_branch: str = 'main',
         auto_push: bool = False,
         create_branch: bool = True
@@ -1874,7 +2750,7 @@ class GitLabWorkflow:
             issue_code: 이슈코드 (e.g., "VTM-1372" or "1372")
             issue_description: Description for the issue
             branch_name: Custom branch name (must follow {issue-code}/{gitlab}-{summary} format)
-            labels: Issue labels
+            labels: Issue labels (list or comma-separated string)
             base_branch: Base branch to create from
             auto_push: Automatically push branch to remote
             create_branch: Create branch after issue (default: True)
@@ -1882,6 +2758,9 @@ class GitLabWorkflow:
         Returns:
             Dictionary with issue and branch information
         """
+        # Labels may be a list or a comma-separated string; keep one list form from here on
+        labels = _normalize_labels(labels)
+
         # Step 1: Create issue
         print("📝 Creating GitLab issue...")
         issue = self.create_issue(issue_title, issue_description, labels)
@@ -1911,16 +2790,7 @@ class GitLabWorkflow:
             # Step 3: Generate or validate branch name
             if not branch_name:
                 # Auto-generate branch name from issue
-                # Remove non-ASCII characters (including Korean) and convert to lowercase
-                sanitized_title = re.sub(r'[^a-zA-Z0-9\s-]', '', issue_title)
-                sanitized_title = re.sub(r'\s+', '-', sanitized_title.strip())
-                sanitized_title = sanitized_title[:50].lower()  # Limit length and convert to lowercase
-
-                # If title becomes empty after sanitization, use issue number only
-                if not sanitized_title or sanitized_title == '-':
-                    branch_name = f"{issue_code.lower()}/{issue_iid}"
-                else:
-                    branch_name = f"{issue_code.lower()}/{issue_iid}-{sanitized_title}"
+                branch_name = _derive_branch_name(issue_code, issue_iid, issue_title)
 
             # Step 4: Create branch
             print(f"\n🌿 Creating branch: {branch_name}")
@@ -1933,14 +2803,14 @@ class GitLabWorkflow:
                 self.pop_stash()
 
             # Step 4: Optionally push branch
-            if auto_push:
+            # Verify before push (no one to ask without a terminal, e.g. CI)
+            if auto_push and sys.stdin.isatty():
                 print(f"\n📤 Ready to push branch to remote: {branch_name}")
                 print(f"   Remote: {self.get_remote_name()}")
 
-                # Verify before push
                 try:
                     response = input("\n🔍 Push to remote? (y/n): ").strip().lower()
-                    if response in ['y', 'yes', '예']:
+                    if response in _YES:
                         print(f"📤 Pushing branch to remote...")
                         self.push_branch(branch_name)
                         pushed = True
@@ -1948,6 +2818,8 @@ class GitLabWorkflow:
                         print("⏸️  Push skipped. You can push manually later with: git push")
                 except (EOFError, KeyboardInterrupt):
                     print("\n⏸️  Push cancelled. You can push manually later with: git push")
+            elif auto_push:
+                print("\n⏸️  Push skipped (non-interactive). You can push manually later with: git push")
         else:
             # No branch created
             branch_name = None
@@ -1962,7 +2834,7 @@ class GitLabWorkflow:
                 branch_name=branch_name,
                 issue_title=issue_title,
                 issue_description=issue_description or '',
-                labels=labels.split(',') if labels else [],
+                labels=labels,
                 pushed=pushed
             )
 
@@ -1980,26 +2852,128 @@ class GitLabWorkflow:
         }
 
 
-def main():
-    # Load environment variables from .claude/.env.gitlab-workflow file ONLY (project-level config)
-    # Get git root directory
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--show-toplevel'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        git_root = result.stdout.strip()
-        env_file_path = os.path.join(git_root, '.claude/.env.gitlab-workflow')
+# Subcommands that talk to the GitLab API (everything else only runs git)
+_NEEDS_API = frozenset({'start', 'branch', 'mr', 'update', 'doctor'})
+
+
+def _base_branch(args: argparse.Namespace, workflow: GitLabWorkflow) -> str:
+    """Base branch from --base, else BASE_BRANCH env var, else main"""
+    return args.base or workflow.base_branch_default
+
+
+def _cmd_start(args: argparse.Namespace, workflow: GitLabWorkflow) -> None:
+    """Run the forced issue -> branch workflow from a JSON file or interactive input"""
+    # Version 2.0: FORCED workflow with JSON or interactive input
+    json_file = args.from_file
+
+    # If interactive mode, run interactive script to generate JSON
+    if args.interactive:
+        print("🔄 Launching interactive mode...\n")
+        json_file = run_interactive_script('interactive_issue_create.py')
+
+        if not json_file:
+            print("Error: Interactive mode failed to generate JSON", file=sys.stderr)
+            sys.exit(1)
+
+    # Require either --from-file or --interactive
+    if not json_file:
+        print("Error: Either --from-file or --interactive is required for start command", file=sys.stderr)
+        print("Examples:", file=sys.stderr)
+        print("  gitlab_workflow.py start --from-file issue.json", file=sys.stderr)
+        print("  gitlab_workflow.py start --interactive", file=sys.stderr)
+        sys.exit(1)
+
+    # Execute forced workflow with JSON file
+    print(f"\n🚀 Starting forced workflow with: {json_file}\n")
+    result = workflow.forced_workflow(
+        json_file_path=json_file,
+        base_branch=_base_branch(args, workflow)
+    )
+
+    if not result.success:
+        print(f"\n❌ Workflow failed: {result.error}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _cmd_branch(args: argparse.Namespace, workflow: GitLabWorkflow) -> None:
+    """Create (and optionally push) a branch"""
+    workflow.create_branch(args.branch_name, ref=_base_branch(args, workflow))
+    if args.push:
+        workflow.push_branch(args.branch_name)
+
+
+def _cmd_push(args: argparse.Namespace, workflow: GitWorkflow) -> None:
+    """Push the given or current branch"""
+    branch_name = args.branch_name or workflow.get_current_branch()
+    workflow.push_branch(branch_name)
+
+
+def _cmd_mr(args: argparse.Namespace, workflow: GitLabWorkflow) -> None:
+    """Create a merge request from the current or given branch"""
+    # Handle interactive mode
+    if args.interactive:
+        print("🔄 Launching interactive mode...\n")
+        json_file = run_interactive_script('interactive_mr_create.py')
+
+        if not json_file:
+            print("Error: Interactive mode failed to generate JSON", file=sys.stderr)
+            sys.exit(1)
+
+        # Load JSON and extract values
+        try:
+            mr_data = json.loads(Path(json_file).read_bytes())
+
+            # Override args with JSON data
+            args.title = mr_data['title']
+            args.target = mr_data.get('targetBranch', args.target)
+            args.issue = mr_data.get('issueIID', args.issue)
+
+            print(f"✅ Loaded MR details from: {json_file}\n")
+
+        except Exception as e:
+            print(f"Error: Failed to load JSON: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # Validate title
+    if not args.title:
+        print("Error: MR title is required", file=sys.stderr)
+        print("Use: gitlab_workflow.py mr --interactive", file=sys.stderr)
+        print("Or:  gitlab_workflow.py mr 'MR Title'", file=sys.stderr)
+        sys.exit(1)
+
+    # Create MR
+    source_branch = args.source or workflow.get_current_branch()
+    mr = workflow.create_merge_request(
+        source_branch,
+        args.target,
+        args.title,
+        description=args.description,
+        issue_iid=args.issue,
+        remove_source_branch=not args.keep_branch
+    )
+    lines = [
+        f"✅ Created merge request !{mr['iid']}: {mr['title']}",
+        f"   Source: {mr['source_branch']} → Target: {mr['target_branch']}",
+        f"   URL: {mr['web_url']}",
+    ]
+    if args.issue:
+        lines.append(f"   Linked to issue #{args.issue} (will auto-close on merge)")
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _cmd_update(args: argparse.Namespace, workflow: GitLabWorkflow) -> None:
+    """Update an issue from the branch's git history"""
+    workflow.update_issue_from_branch(
+        issue_iid=args.issue_iid,
+        branch_name=args.branch,
+        base_branch=_base_branch(args, workflow),
+        update_title=args.update_title
+    )
 
-        if os.path.exists(env_file_path):
-            load_env_file(env_file_path)
-        # else: No warning if file doesn't exist - env vars can be set manually
-    except subprocess.CalledProcessError:
-        # Not in a git repository - skip loading env file
-        pass
 
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once per process (reused when main() is called repeatedly)"""
     parser = argparse.ArgumentParser(
         description='GitLab Workflow Automation',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2038,16 +3012,19 @@ Examples:
     start_parser.add_argument('--interactive', '-i', action='store_true',
                              help='Interactive mode (prompt for input)')
     start_parser.add_argument('--base', help='Base branch (default: from BASE_BRANCH env var)')
+    start_parser.set_defaults(func=_cmd_start)
 
     # Create branch only
     branch_parser = subparsers.add_parser('branch', help='Create branch (must follow {issue-code}/{gitlab} format)')
     branch_parser.add_argument('branch_name', help='Branch name (e.g., VTM-1372/305-feature)')
     branch_parser.add_argument('--base', help='Base branch (default: from BASE_BRANCH env var or "main")')
     branch_parser.add_argument('--push', action='store_true', help='Auto-push to remote')
+    branch_parser.set_defaults(func=_cmd_branch)
 
     # Push branch
     push_parser = subparsers.add_parser('push', help='Push current branch to remote')
     push_parser.add_argument('branch_name', nargs='?', help='Branch name (optional, uses current branch)')
+    push_parser.set_defaults(func=_cmd_push)
 
     # Create MR
     mr_parser = subparsers.add_parser('mr', help='Create merge request')
@@ -2060,9 +3037,13 @@ Examples:
                           help='Keep source branch after merge')
     mr_parser.add_argument('--interactive', '-i', action='store_true',
                           help='Interactive mode (auto-detect and confirm)')
+    mr_parser.set_defaults(func=_cmd_mr)
 
     # Init - initialize environment with interactive prompts
     init_parser = subparsers.add_parser('init', help='Initialize GitLab workflow environment with interactive setup')
+    init_parser.add_argument('--config-json', action='store_true',
+                             help='Read settings as a JSON object from stdin instead of prompting '
+                                  '(keys: gitlab_url, gitlab_token, gitlab_project, gitlab_remote, issue_dir, base_branch)')
 
     # Doctor - validate environment
     doctor_parser = subparsers.add_parser('doctor', help='Validate environment setup and configuration')
@@ -2077,43 +3058,70 @@ Examples:
     update_parser.add_argument('--base', help='Base branch to compare (default: from BASE_BRANCH env var or "main")')
     update_parser.add_argument('--update-title', action='store_true',
                                help='Update issue title from first commit')
+    update_parser.set_defaults(func=_cmd_update)
 
-    args = parser.parse_args()
+    return parser
 
-    # Get credentials and configuration
-    gitlab_url = args.url or os.getenv('GITLAB_URL')
-    token = args.token or os.getenv('GITLAB_TOKEN')
-    project_id = args.project or os.getenv('GITLAB_PROJECT')
-    remote_name = args.remote or os.getenv('GITLAB_REMOTE')
-    # Support both new (ISSUE_CODE) and legacy (ASANA_ISSUE) env vars for backward compatibility
-    issue_code = getattr(args, 'issue_code', None) or os.getenv('ISSUE_CODE') or os.getenv('ASANA_ISSUE')
-    issue_dir = os.getenv('ISSUE_DIR')
-    base_branch_default = os.getenv('BASE_BRANCH', 'main')
+
+def main():
+    parser = _build_parser()
+    args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    # Help command - show comprehensive usage help (needs no configuration)
+    if args.command == 'help':
+        # Kept in a sibling file so the text is only read when asked for
+        print('\n' + (_SCRIPT_DIR / 'gitlab_workflow_help.txt').read_text(encoding='utf-8'))
+        sys.exit(0)
+
+    # Load environment variables from .claude/.env.gitlab-workflow file ONLY (project-level config)
+    # GITLAB_WORKFLOW_ENV_PATH names the file directly and skips the git root lookup
+    env = os.environ
+    env_file_path = env.get('GITLAB_WORKFLOW_ENV_PATH')
+    if env_file_path and os.path.isfile(env_file_path):
+        load_env_file(env_file_path)
+    else:
+        # No warning if file doesn't exist (or not in a git repository) - env vars can be set manually
+        env_file = _find_env_file()
+        if env_file:
+            load_env_file(str(env_file))
+            # Inherited by child processes so nested runs skip the lookup
+            env['GITLAB_WORKFLOW_ENV_PATH'] = str(env_file)
+
+    # Get credentials and configuration
+    gitlab_url = args.url or env.get('GITLAB_URL')
+    token = args.token or env.get('GITLAB_TOKEN')
+    project_id = args.project or env.get('GITLAB_PROJECT')
+    remote_name = args.remote or env.get('GITLAB_REMOTE')
+    # Support both new (ISSUE_CODE) and legacy (ASANA_ISSUE) env vars for backward compatibility
+    issue_code = getattr(args, 'issue_code', None) or env.get('ISSUE_CODE') or env.get('ASANA_ISSUE')
+    issue_dir = env.get('ISSUE_DIR')
+
     # Init command - initialize environment with interactive prompts
     if args.command == 'init':
         # Get git root to determine .env file path
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--show-toplevel'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            git_root = result.stdout.strip()
-            env_file_path = os.path.join(git_root, '.claude/.env.gitlab-workflow')
-        except subprocess.CalledProcessError:
+        git_root = _find_git_root()
+        if not git_root:
             print("❌ Error: Not in a git repository", file=sys.stderr)
             print("💡 Run 'git init' or cd to your git repository first", file=sys.stderr)
             sys.exit(1)
+        env_file_path = os.path.join(git_root, '.claude/.env.gitlab-workflow')
+
+        # Non-interactive settings (CI): one JSON object on stdin
+        config = None
+        if args.config_json:
+            try:
+                config = json.load(sys.stdin)
+            except json.JSONDecodeError as e:
+                print(f"❌ Error: Invalid JSON on stdin: {e}", file=sys.stderr)
+                sys.exit(1)
 
         # Run interactive initialization
         try:
-            success = initialize_env_file(env_file_path)
+            success = initialize_env_file(env_file_path, config)
             if success:
                 print("\n🔍 Validating configuration...\n")
 
@@ -2122,11 +3130,11 @@ Examples:
 
                 # Create workflow instance and run doctor
                 workflow = GitLabWorkflow(
-                    os.getenv('GITLAB_URL', ''),
-                    os.getenv('GITLAB_TOKEN', ''),
-                    os.getenv('GITLAB_PROJECT', ''),
-                    os.getenv('GITLAB_REMOTE'),
-                    os.getenv('ISSUE_DIR')
+                    env.get('GITLAB_URL', ''),
+                    env.get('GITLAB_TOKEN', ''),
+                    env.get('GITLAB_PROJECT', ''),
+                    env.get('GITLAB_REMOTE'),
+                    env.get('ISSUE_DIR')
                 )
 
                 # Run doctor validation
@@ -2169,384 +3177,28 @@ Examples:
             print(f"\n❌ Doctor failed: {str(e)}", file=sys.stderr)
             sys.exit(1)
 
-    # Help command - show comprehensive usage help
-    if args.command == 'help':
-        print("""
-📚 GitLab Workflow - Complete Usage Guide (Version 2.0: FORCED Workflow Edition)
-
-═══════════════════════════════════════════════════════════════
-
-## 🆕 Version 2.0 Changes
-
-**FORCED Workflow** - Fully automated, zero-choice workflow:
-✅ JSON-only input (no interactive prompts)
-✅ Automatic dirty state handling (stash → switch → pull → branch → push → pop)
-✅ AI-powered issue updates
-✅ Atomic rollback on failure
-
-═══════════════════════════════════════════════════════════════
-
-## Available Commands
-
-1. **init** - Initialize Environment (⭐ Run First!)
-   /gitlab-init
-
-   Interactive setup wizard:
-   • Creates .claude/.env.gitlab-workflow
-   • Prompts for GitLab URL, token, project
-   • Sets secure file permissions (600)
-   • Auto-validates configuration
-   • Backs up existing configuration
-
-2. **doctor** - Validate Environment
-   /gitlab-doctor
-
-   Checks:
-   • Environment variables
-   • Git repository status
-   • Git remote configuration
-   • GitLab API connectivity
-   • Token permissions
-   • Issue directory setup
-
-3. **start** - FORCED Automated Workflow (⭐ Version 2.0)
-
-   REQUIRED: JSON file with issue data
-
-   gitlab_workflow.py start --from-file issue.json
-
-   What it does (automatically, no user interaction):
-   1. ✅ Validates environment and JSON
-   2. ✅ Creates GitLab issue
-   3. ✅ Stashes uncommitted changes (if any)
-   4. ✅ Switches to base branch
-   5. ✅ Pulls latest changes
-   6. ✅ Creates new branch
-   7. ✅ Pushes branch to remote
-   8. ✅ Restores stashed changes
-   9. 🤖 AI analyzes and updates issue
-   10. ✅ Saves issue.json
-
-   On failure: Automatic rollback to clean state
-
-4. **update** - Update Issue from Git History (⭐ Auto-extracts issue #)
-
-   Simple (auto-extracts issue number from branch):
-   /gitlab-issue-update
-
-   With specific issue:
-   /gitlab-issue-update 345
-
-   With title update:
-   /gitlab-issue-update --update-title
-
-5. **mr** - Create Merge Request (⭐ Auto-generates description with issue requirements)
-
-   Interactive:
-   /gitlab-mr
-
-   Auto-generated MR description includes:
-   • Issue summary (title, status, labels)
-   • Requirements from issue description
-   • Implementation summary from commits
-   • Change statistics and detailed commit history
-
-   CLI:
-   gitlab_workflow.py mr "Fix bug" --issue 345 --target main
-
-6. **help** - Show This Help
-   gitlab_workflow.py help
-
-═══════════════════════════════════════════════════════════════
-
-## Complete Workflow Example
-
-# Step 0: Initialize (first time only)
-/gitlab-init
-
-# Step 1: Validate setup
-/gitlab-doctor
-
-# Step 2: Create issue and branch
-/gitlab-issue-create
-# Answer questions:
-# - 이슈코드: VTM-1372
-# - Title: Add logout button
-# - Description: (optional)
-# - Labels: feature
-# - Auto-push: yes
-
-# Step 3: Make changes
-git add .
-git commit -m "VTM-1372 feat: implement logout button"
-git push
-
-# Step 4: Update issue with requirements
-/gitlab-issue-update
-# → Auto-extracts issue #342 from branch "vtm-1372/342-add-logout-button"
-# → Updates issue description with requirements summary
-
-# Step 5: Create merge request
-/gitlab-mr
-# Answer questions:
-# - MR title: Add logout button
-# - Link to issue: 342
-# - Target branch: main
-
-═══════════════════════════════════════════════════════════════
-
-## JSON File Format
-
-Create: docs/requirements/vtm-1372/342/issue.json
-
-```json
-{
-  "issueCode": "VTM-1372",
-  "title": "Add logout button",
-  "description": "Add logout functionality to nav bar",
-  "labels": ["feature", "ui"],
-  "push": true
-}
-```
-
-Then:
-/gitlab-issue-create --from-file docs/requirements/vtm-1372/342/issue.json
-
-═══════════════════════════════════════════════════════════════
-
-## Key Features
-
-✨ **Interactive Setup**
-   /gitlab-init provides step-by-step wizard for environment setup
-   Validates input and sets secure file permissions automatically
-
-✨ **Auto-Extract Issue Number**
-   /gitlab-issue-update automatically finds issue # from branch name
-   Branch: vtm-1372/345-feature → Issue #345 (no manual input!)
-
-✨ **Auto-Generate MR Description with Issue Requirements**
-   /gitlab-mr creates comprehensive description with:
-   • Issue summary (title, status, labels, URL)
-   • Requirements from issue description (요구사항)
-   • Implementation summary from commits (구현 내용)
-   • Change statistics and detailed commit history
-   Perfect for code reviews - shows what was requested vs. what was delivered!
-
-✨ **Requirements vs Implementation**
-   • Issue update (/gitlab-issue-update): Requirements (what to do)
-   • MR creation (/gitlab-mr): Implementation (what was done) + Requirements mapping
-
-✨ **Auto-Save issue.json**
-   When creating issues, automatically saves to:
-   docs/requirements/{issue-code}/{gitlab}/issue.json
-
-═══════════════════════════════════════════════════════════════
-
-## Branch Name Format
-
-✅ Valid:
-   VTM-1372/342-add-feature
-   1372/342-fix-bug
-   VTM-999/307-refactor
-
-❌ Invalid:
-   342-feature (missing 이슈코드)
-   VTM-1372-342 (wrong separator)
-   feature-name (missing numbers)
-
-Format: {issue-code}/{gitlab#}-{summary}
-
-═══════════════================================================================
-
-## Environment Configuration
-
-File: .claude/.env.gitlab-workflow
-
-```bash
-# Required
-GITLAB_URL=http://192.168.210.103:90
-GITLAB_TOKEN=glpat-xxxxxxxxxxxxx
-GITLAB_PROJECT=withvtm_2.0/withvtm-fe
-
-# Optional
-GITLAB_REMOTE=gitlab
-ISSUE_DIR=docs/requirements
-BASE_BRANCH=main              # or: develop, origin/main, gitlab/develop
-```
-
-Note: BASE_BRANCH can be:
-  - Branch name only: main, develop (uses default remote)
-  - With remote: origin/main, gitlab/develop (explicit remote)
-  - Always fetches from remote to ensure latest code
-```
-
-Get token:
-1. GitLab → User Settings → Access Tokens
-2. Create token with 'api' scope
-3. Copy to .env.gitlab-workflow
-
-═══════════════════════════════════════════════════════════════
-
-## Troubleshooting
-
-Problem: "GITLAB_URL required"
-Solution: Create .claude/.env.gitlab-workflow with required vars
-
-Problem: "Invalid branch name"
-Solution: Use format {issue-code}/{gitlab#}-{summary}
-
-Problem: "No git remote found"
-Solution: git remote add gitlab http://your-gitlab-server.com/project.git
-
-Problem: "Connection failed"
-Solution: Run /gitlab-workflow doctor for detailed diagnosis
-
-═══════════════════════════════════════════════════════════════
-
-## Documentation
-
-• Full documentation: .claude/skills/gitlab-workflow/SKILL.md
-• JSON guide: .claude/skills/gitlab-workflow/README.md
-• AI guide: .claude/skills/gitlab-workflow/AI_GUIDE.md
-• Quick reference: .claude/skills/gitlab-workflow/QUICK_REFERENCE.md
-• Update guide: .claude/skills/gitlab-workflow/UPDATE_SUMMARY.md
-• Doctor guide: .claude/skills/gitlab-workflow/DOCTOR_GUIDE.md
-
-═══════════════════════════════════════════════════════════════
-
-For detailed help on specific commands, run:
-  gitlab_workflow.py <command> --help
-
-Example:
-  gitlab_workflow.py start --help
-  gitlab_workflow.py update --help
-  gitlab_workflow.py mr --help
-
-═══════════════════════════════════════════════════════════════
-        """)
-        sys.exit(0)
-
-    # Validate required credentials for other commands
-    if not gitlab_url:
-        print("Error: GitLab URL required (--url or GITLAB_URL env var)", file=sys.stderr)
-        sys.exit(1)
-
-    if not token:
-        print("Error: Personal Access Token required (--token or GITLAB_TOKEN env var)", file=sys.stderr)
-        sys.exit(1)
-
-    if not project_id:
-        print("Error: Project ID required (--project or GITLAB_PROJECT env var)", file=sys.stderr)
-        sys.exit(1)
+    if args.command in _NEEDS_API:
+        # Validate required credentials for other commands (reported together)
+        required = {'GITLAB_URL': gitlab_url, 'GITLAB_TOKEN': token, 'GITLAB_PROJECT': project_id}
+        missing = [name for name, value in required.items() if not value]
+        if missing:
+            print(f"Error: {', '.join(missing)} required "
+                  f"(--url/--token/--project or .claude/.env.gitlab-workflow)", file=sys.stderr)
+            sys.exit(1)
 
-    # Check issue code for start command
-    if args.command == 'start' and not issue_code:
-        print("Error: 이슈코드 required for start command (--issue-code or ISSUE_CODE env var)", file=sys.stderr)
-        sys.exit(1)
+        # Check issue code for start command
+        if args.command == 'start' and not issue_code:
+            print("Error: 이슈코드 required for start command (--issue-code or ISSUE_CODE env var)", file=sys.stderr)
+            sys.exit(1)
 
-    # Initialize workflow
-    workflow = GitLabWorkflow(gitlab_url, token, project_id, remote_name, issue_dir)
+        # Initialize workflow
+        workflow = GitLabWorkflow(gitlab_url, token, project_id, remote_name, issue_dir)
+    else:
+        # Git-only commands (push) need neither credentials nor an API client
+        workflow = GitWorkflow(remote_name)
 
     try:
-        if args.command == 'start':
-            # Version 2.0: FORCED workflow with JSON or interactive input
-            json_file = args.from_file
-
-            # If interactive mode, run interactive script to generate JSON
-            if args.interactive:
-                print("🔄 Launching interactive mode...\n")
-                json_file = run_interactive_script('interactive_issue_create.py')
-
-                if not json_file:
-                    print("Error: Interactive mode failed to generate JSON", file=sys.stderr)
-                    sys.exit(1)
-
-            # Require either --from-file or --interactive
-            if not json_file:
-                print("Error: Either --from-file or --interactive is required for start command", file=sys.stderr)
-                print("Examples:", file=sys.stderr)
-                print("  gitlab_workflow.py start --from-file issue.json", file=sys.stderr)
-                print("  gitlab_workflow.py start --interactive", file=sys.stderr)
-                sys.exit(1)
-
-            # Execute forced workflow with JSON file
-            print(f"\n🚀 Starting forced workflow with: {json_file}\n")
-            result = workflow.forced_workflow(
-                json_file_path=json_file,
-                base_branch=args.base or base_branch_default
-            )
-
-            if not result.success:
-                print(f"\n❌ Workflow failed: {result.error}", file=sys.stderr)
-                sys.exit(1)
-
-        elif args.command == 'branch':
-            workflow.create_branch(args.branch_name, ref=args.base or base_branch_default)
-            if args.push:
-                workflow.push_branch(args.branch_name)
-
-        elif args.command == 'push':
-            branch_name = args.branch_name or workflow.get_current_branch()
-            workflow.push_branch(branch_name)
-
-        elif args.command == 'mr':
-            # Handle interactive mode
-            if args.interactive:
-                print("🔄 Launching interactive mode...\n")
-                json_file = run_interactive_script('interactive_mr_create.py')
-
-                if not json_file:
-                    print("Error: Interactive mode failed to generate JSON", file=sys.stderr)
-                    sys.exit(1)
-
-                # Load JSON and extract values
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        mr_data = json.load(f)
-
-                    # Override args with JSON data
-                    args.title = mr_data['title']
-                    args.target = mr_data.get('targetBranch', args.target)
-                    args.issue = mr_data.get('issueIID', args.issue)
-
-                    print(f"✅ Loaded MR details from: {json_file}\n")
-
-                except Exception as e:
-                    print(f"Error: Failed to load JSON: {e}", file=sys.stderr)
-                    sys.exit(1)
-
-            # Validate title
-            if not args.title:
-                print("Error: MR title is required", file=sys.stderr)
-                print("Use: gitlab_workflow.py mr --interactive", file=sys.stderr)
-                print("Or:  gitlab_workflow.py mr 'MR Title'", file=sys.stderr)
-                sys.exit(1)
-
-            # Create MR
-            source_branch = args.source or workflow.get_current_branch()
-            mr = workflow.create_merge_request(
-                source_branch,
-                args.target,
-                args.title,
-                description=args.description,
-                issue_iid=args.issue,
-                remove_source_branch=not args.keep_branch
-            )
-            print(f"✅ Created merge request !{mr['iid']}: {mr['title']}")
-            print(f"   Source: {mr['source_branch']} → Target: {mr['target_branch']}")
-            print(f"   URL: {mr['web_url']}")
-            if args.issue:
-                print(f"   Linked to issue #{args.issue} (will auto-close on merge)")
-
-        elif args.command == 'update':
-            # Update issue from git history
-            result = workflow.update_issue_from_branch(
-                issue_iid=args.issue_iid,
-                branch_name=args.branch,
-                base_branch=args.base or base_branch_default,
-                update_title=args.update_title
-            )
-
+        args.func(args, workflow)
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
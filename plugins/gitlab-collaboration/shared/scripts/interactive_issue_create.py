@@ -13,10 +13,14 @@ Output:
 
 import json
 import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+# Accept formats: VTM-1372, 1372, PROJ-123, etc.
+_ISSUE_CODE_RE = re.compile(r'^[A-Z0-9]+-?\d*$|^\d+$')
+
 
 def print_banner():
     """Print interactive mode banner"""
@@ -98,10 +102,7 @@ def validate_issue_code(issue_code: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Accept formats: VTM-1372, 1372, PROJ-123, etc.
-    import re
-    pattern = r'^[A-Z0-9]+-?\d*$|^\d+$'
-    return bool(re.match(pattern, issue_code.upper()))
+    return bool(_ISSUE_CODE_RE.match(issue_code.upper()))
 
 
 def prompt_issue_code() -> str:
@@ -232,8 +233,7 @@ def save_to_json(issue_data: dict) -> str:
     filepath = temp_dir / filename
 
     # Write JSON file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(issue_data, f, ensure_ascii=False, indent=2)
+    filepath.write_text(json.dumps(issue_data, ensure_ascii=False, indent=2), encoding='utf-8')
 
     return str(filepath)
 
@@ -19,6 +19,9 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+_IID_RE = re.compile(r'/(\d+)')
+_CC_PREFIX_RE = re.compile(r'^(feat|fix|refactor|docs|style|test|chore):\s*')
+
 
 def print_banner():
     """Print interactive mode banner"""
@@ -53,7 +56,7 @@ def extract_issue_iid(branch_name: str) -> int:
     Returns:
         Issue IID or None
     """
-    match = re.search(r'/(\d+)', branch_name)
+    match = _IID_RE.search(branch_name)
     return int(match.group(1)) if match else None
 
 
@@ -80,7 +83,7 @@ def get_first_commit_subject(branch_name: str, target_branch: str = 'main') -> s
         if commits and commits[0]:
             subject = commits[0]
             # Remove conventional commit prefix
-            subject = re.sub(r'^(feat|fix|refactor|docs|style|test|chore):\s*', '', subject)
+            subject = _CC_PREFIX_RE.sub('', subject, count=1)
             return subject
     except:
         pass
@@ -274,8 +277,7 @@ def save_to_json(mr_details: dict) -> str:
         json_data["issueIID"] = mr_details['issue_iid']
 
     # Write JSON file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
+    filepath.write_text(json.dumps(json_data, ensure_ascii=False, indent=2), encoding='utf-8')
 
     return str(filepath)
 